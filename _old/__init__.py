@@ -1,14 +1,31 @@
 #!/usr/bin/env python3
-from . import iso
-from . import tolerances
-from . import preferred_numbers
-from . import stresses
-from . import thread
+import importlib
+from . import stackup
+from . import intervals
+
+# Submodules are imported on first attribute access, see __getattr__. Most of
+# them pull in pint or NumPy, which dominates the import time of the package.
+_SUBMODULES = ('iso', 'tolerances', 'preferred_numbers', 'stresses', 'thread',
+               'fatigue', 'units', 'tables', 'sweep')
+
+def __getattr__(name):
+  if name in _SUBMODULES:
+    module = importlib.import_module('.' + name, __name__)
+    globals()[name] = module
+    return module
+  raise(AttributeError('module \'{}\' has no attribute \'{}\''.format(__name__, name)))
+
+def __dir__():
+  return sorted(set(globals()) | set(_SUBMODULES))
 
 
 class Dim:
-  def __init__(self, nom, d1, d2=None, mt='worst-case'):
-    # Compare type: 
+  # Dims are immutable. Arithmetic returns a new Dim whose terms refer to the
+  # operands, so stack-ups share their sub-assemblies instead of copying them.
+  __slots__ = ('COMPARE_TYPE', 'MODEL_TYPE', 'value', 'dmin', 'dmax', 'min', 'max',
+               '_leaf', '_terms', '_sums')
+  def __init__(self, nom, d1, d2=None, mt='worst-case', dist='normal', ct='exact'):
+    # Compare type, see intervals.compare() for the array version: 
     #   'exact'        Exact comparison.
     #                  (5 +0.5/-0.2) != (5.2 +0.3/-0.4)
     #   'equivalent'   Equivalent comparison.
@@ -20,37 +37,149 @@ class Dim:
     #                  occur that both (a == b), (b != a) are true.
     #                  (5 +0.5/-0.2) == (5.5 +0.2/-0.5)
     #                  (5 +0.5/-0.2) != (5.5 +0.5/-0.2)
-    #   'sd.5'
+    #   'sd.5'        Statistical overlap compare. As 'linear.5', but the
+    #                  ratio is the probability of the distribution of the
+    #                  first dimension, see statistics(), within the limits of
+    #                  the second.
+    #                  (5 +0.5/-0.2) == (5.5 +0.2/-0.5)
+    #                  (5 +0.5/-0.2) != (5.4 +0.5/-0.2)
+    # Compound dimensions take the compare type of their left operand.
     # Contain type:
-    self.COMPARE_TYPE = 'exact'
-    self.MODEL_TYPE = mt # currently only 'worst-case' is implemented.
-                         # Statistical variation, aka. 'stat-var', is still on
-                         # the to-do list.
-    self.value = nom
+    #
+    # Model type:
+    #   'worst-case'   Worst-case summation of deviations.
+    #   'rss'          Root-sum-square of the tolerance bands, centred on the
+    #                  band middles.
+    #   'stat-var'     Statistical variation. Keeps worst-case limits in
+    #                  min/max, the distribution is available through
+    #                  statistics() and simulate().
+    #
+    # Distribution of this contributor within its tolerance band, used by
+    # statistics() and simulate(). One of stackup.DISTRIBUTIONS.
+    if dist not in stackup.DISTRIBUTIONS:
+      raise(ValueError('Unknown distribution: \'{}\''.format(dist)))
     if d2==None: d2 = -1 * d1
-    self.dmin = min(d1, d2)
-    self.dmax = max(d1, d2)
-    self.min = self.value + self.dmin
-    self.max = self.value + self.dmax
-    self._compound = [[[self.value, self.dmin, self.dmax]],[]]
-  def recalculate(self):
-    if self.MODEL_TYPE == 'worst-case':
-      val = 0
-      dmin = 0
-      dmax = 0
-      for v in self._compound[0]:
-        val = val + v[0]
-        dmin = dmin + v[1]
-        dmax = dmax + v[2]
-      for v in self._compound[1]:
-        val = val - v[0]
-        dmin = dmin - v[1]
-        dmax = dmax - v[2]
-    self.value = val
-    self.dmin = dmin
-    self.dmax = dmax
-    self.min = self.value + self.dmin
-    self.max = self.value + self.dmax
+    dmin = min(d1, d2)
+    dmax = max(d1, d2)
+    self._init(ct, mt, (nom, dmin, dmax, dist), None,
+               stackup.moments(nom, dmin, dmax, dist))
+  def _init(self, ct, mt, leaf, terms, sums):
+    # Running sums over all contributors, see stackup.moments(). Combining two
+    # Dims is O(1), independent of the length of the stack-up.
+    value, dmin, dmax, mid, halfsq, mean, var = sums
+    if mt == 'rss':
+      dmin = mid - halfsq**(1/2)
+      dmax = mid + halfsq**(1/2)
+    elif mt not in ('worst-case', 'stat-var'):
+      raise(ValueError('Unknown model type: \'{}\''.format(mt)))
+    intervals.compare_type(ct)
+    for name, val in (('COMPARE_TYPE', ct), ('MODEL_TYPE', mt),
+                      ('value', value), ('dmin', dmin), ('dmax', dmax),
+                      ('min', value + dmin), ('max', value + dmax),
+                      ('_leaf', leaf), ('_terms', terms), ('_sums', sums)):
+      object.__setattr__(self, name, val)
+  @classmethod
+  def _combine(cls, mt, ct, terms):
+    """New compound Dim from (coefficient, Dim) terms. A negative coefficient
+    subtracts the Dim."""
+    sums = (0,) * 7
+    for coef, dim in terms:
+      part = dim._sums if coef > 0 else stackup.negate(dim._sums)
+      sums = tuple(a + abs(coef) * b for a, b in zip(sums, part))
+    self = object.__new__(cls)
+    self._init(ct, mt, None, tuple(terms), sums)
+    return self
+  def __setattr__(self, name, value):
+    raise(AttributeError('\'Dim\' objects are immutable.'))
+  def __delattr__(self, name):
+    raise(AttributeError('\'Dim\' objects are immutable.'))
+  def __reduce__(self):
+    if self._terms is None:
+      return (_leaf_dim, (self.COMPARE_TYPE, self.MODEL_TYPE) + self._leaf)
+    # Compound Dims are pickled as a flat list of nodes, so the depth of the
+    # stack-up doesn't run into the recursion limit of pickle. Terms refer to
+    # earlier nodes by index, shared sub-assemblies stay shared.
+    index, nodes = {}, []
+    for dim in self._order():
+      terms = None
+      if dim._terms is not None:
+        terms = tuple((coef, index[id(child)]) for coef, child in dim._terms)
+      index[id(dim)] = len(nodes)
+      nodes.append((dim.COMPARE_TYPE, dim.MODEL_TYPE, dim._leaf, terms))
+    return (_graph_dim, (tuple(nodes),))
+  def __hash__(self):
+    # Equal Dims have equal limits under every compare type that is transitive.
+    # Overlap compares aren't, so those Dims can't be used as keys.
+    if intervals.compare_type(self.COMPARE_TYPE)[0] not in ('exact', 'equivalent'):
+      raise(TypeError('unhashable Dim with compare type \'{}\''.format(self.COMPARE_TYPE)))
+    return hash((self.min, self.max))
+  def __eq__(self, other):
+    if not isinstance(other, Dim):
+      return NotImplemented
+    kind, ratio = intervals.compare_type(self.COMPARE_TYPE)
+    if kind == 'exact':
+      return (self.value, self.dmin, self.dmax) == (other.value, other.dmin, other.dmax)
+    elif kind == 'equivalent':
+      return (self.min, self.max) == (other.min, other.max)
+    elif kind == 'linear':
+      return bool(intervals.linear_fraction(self.min, self.max, other.min, other.max) >= ratio)
+    mean, sd = self.statistics()
+    return bool(intervals.normal_fraction(mean, sd, other.min, other.max) >= ratio)
+  def compare_as(self, ct):
+    """Returns this Dim with compare type 'ct'. The stack-up is shared."""
+    dim = object.__new__(Dim)
+    dim._init(ct, self.MODEL_TYPE, self._leaf, self._terms, self._sums)
+    return dim
+  def _order(self):
+    # The Dims of the stack-up in post-order, every Dim after the Dims it is
+    # made of. Iterative, as stack-ups can be deeper than the recursion limit.
+    order, seen, stack = [], set(), [(self, False)]
+    while stack:
+      dim, done = stack.pop()
+      if done:
+        order.append(dim)
+      elif id(dim) not in seen:
+        seen.add(id(dim))
+        stack.append((dim, True))
+        for coef, child in dim._terms or ():
+          stack.append((child, False))
+    return order
+  def contributors(self):
+    """Returns the ((nom, dmin, dmax, dist), added, subtracted) contributors of
+    the stack-up, with the number of times each is added and subtracted.
+    Shared sub-assemblies are visited once."""
+    # Reverse post-order visits every Dim before the Dims it is made of.
+    counts = {id(self): [1, 0]}
+    result = []
+    for dim in reversed(self._order()):
+      add, sub = counts[id(dim)]
+      if dim._terms is None:
+        result.append((dim._leaf, add, sub))
+        continue
+      for coef, child in dim._terms:
+        c = counts.setdefault(id(child), [0, 0])
+        if coef > 0:
+          c[0] += coef * add
+          c[1] += coef * sub
+        else:
+          c[0] -= coef * sub
+          c[1] -= coef * add
+    return result
+  def statistics(self):
+    """Analytic mean and standard deviation of the stack-up, from the summed
+    means and variances of the contributor distributions."""
+    return self._sums[5], self._sums[6]**(1/2)
+  def simulate(self, samples=10**6, lsl=None, usl=None, seed=None):
+    """Monte Carlo simulation of the stack-up. Samples every contributor from
+    its distribution and returns a stackup.StackupResult. The specification
+    limits for Cpk default to the worst-case min and max."""
+    contributors = []
+    for leaf, add, sub in self.contributors():
+      contributors.extend([(1,) + leaf] * add + [(-1,) + leaf] * sub)
+    return stackup.monte_carlo(contributors, samples,
+                               lsl=self.min if lsl is None else lsl,
+                               usl=self.max if usl is None else usl,
+                               seed=seed)
   def __repr__(self):
     return "<class '{0}.{1}'> {2:} ({3:}/{4:})".format(self.__module__, self.__class__.__name__, self.value, self.dmax, self.dmin)
   def __str__(self):
@@ -60,22 +189,24 @@ class Dim:
   def __add__(self, other):
     # method for arithmetic operation "+"
     if isinstance(other, Dim):
-      self._compound[0].extend(other._compound[0])
-      self._compound[1].extend(other._compound[1])
-      self.recalculate()
-      return self
+      return Dim._combine(self.MODEL_TYPE, self.COMPARE_TYPE, ((1, self), (1, other)))
+    return NotImplemented
   def __sub__(self, other):
-    if isinstance(other, Dim):
-      self._compound[0].extend(other._compound[1])
-      self._compound[1].extend(other._compound[0])
     # method for arithmetic operation "-"
+    if isinstance(other, Dim):
+      return Dim._combine(self.MODEL_TYPE, self.COMPARE_TYPE, ((1, self), (-1, other)))
+    return NotImplemented
   def __mul__(self, other):
     # method for arithmetic operation "*"
     if (isinstance(other, int) or
         (isinstance(other, float) and other.is_integer())):
-      self._compound[0] = int(other) * self._compound[0]
-      self._compound[1] = int(other) * self._compound[1]
+      if int(other) == 0:
+        return Dim(0, 0, mt=self.MODEL_TYPE, ct=self.COMPARE_TYPE)
+      return Dim._combine(self.MODEL_TYPE, self.COMPARE_TYPE, ((int(other), self),))
     return NotImplemented
+  __rmul__ = __mul__
+  def __neg__(self):
+    return self * -1
   def __truediv__(self, other):  return NotImplemented
   def __matmul__(self, other):   return NotImplemented
   def __floordiv__(self, other): return NotImplemented
@@ -88,6 +219,20 @@ class Dim:
   def __xor__(self, other):      return NotImplemented
   def __or__(self, other):       return NotImplemented
 
+def _leaf_dim(ct, mt, nom, dmin, dmax, dist):
+  # Unpickles a single-contributor Dim.
+  return Dim(nom, dmin, dmax, mt=mt, dist=dist, ct=ct)
+
+def _graph_dim(nodes):
+  # Unpickles a compound Dim from the nodes of Dim.__reduce__.
+  dims = []
+  for ct, mt, leaf, terms in nodes:
+    if terms is None:
+      dims.append(_leaf_dim(ct, mt, *leaf))
+    else:
+      dims.append(Dim._combine(mt, ct, [(coef, dims[i]) for coef, i in terms]))
+  return dims[-1]
+
 class Mat:
   def __init__(self):
     # 
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Streaming fatigue damage accumulation. Load-time histories are read in chunks,
+reduced to turning points, rainflow counted incrementally and accumulated with
+the Palmgren-Miner rule, so histories larger than memory can be processed.
+"""
+import io
+import itertools
+import numpy as np
+
+from . import tables as screwed_tables
+from . import units as screwed_units
+
+__all__ = ['read_history', 'Rainflow', 'rainflow', 'SNCurve', 'Damage',
+           'thread_damage']
+
+def read_history(file, column=0, chunksize=65536, delimiter=None):
+  """
+Yields the samples of a load-time history as NumPy arrays of at most
+'chunksize' values. 'file' is a path or a file object of either a text file
+(one sample per line, or delimited columns of which 'column' is read) or a
+tables.ColumnarWriter file, in which case 'column' is a column name or index.
+
+  """
+  if isinstance(file, str):
+    with open(file, 'rb') as f:
+      columnar = f.read(len(screwed_tables.ColumnarWriter.MAGIC)) == screwed_tables.ColumnarWriter.MAGIC
+    with open(file, 'rb' if columnar else 'r') as f:
+      yield from read_history(f, column, chunksize, delimiter)
+    return
+  if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+    for group in screwed_tables.read_columnar(file):
+      data = group[column] if not isinstance(column, int) else list(group.values())[column]
+      for start in range(0, len(data), chunksize):
+        yield data[start:start+chunksize]
+    return
+  while True:
+    lines = [l for l in itertools.islice(file, chunksize) if l.strip()]
+    if not lines: return
+    yield np.loadtxt(lines, delimiter=delimiter, usecols=column, ndmin=1)
+
+class Rainflow:
+  """
+Incremental rainflow counter, three-point algorithm of ASTM E1049: a range
+is counted as soon as the next range is at least as large. Feed chunks of a
+history in order; every call returns the cycles closed so far as a tuple of
+(low, high, count) arrays, with a count of 1 for full cycles and .5 for ranges
+that contain the starting point. finish() counts the ranges of the residue as
+half cycles. Only the residue of open cycles is kept between chunks.
+
+  """
+  def __init__(self):
+    self._stack = []
+    self._turn = None     # last emitted turning point
+    self._pending = None  # last sample, not yet known to be a turning point
+  def _turning_points(self, chunk):
+    head = [v for v in (self._turn, self._pending) if v is not None]
+    x = np.concatenate((head, np.asarray(chunk, dtype=float).ravel()))
+    if len(x) == 0:
+      return x
+    x = x[np.r_[True, np.diff(x) != 0]]
+    d = np.diff(x)
+    interior = np.flatnonzero(d[:-1] * d[1:] < 0) + 1
+    if self._turn is None:
+      interior = np.r_[0, interior]
+    points = x[interior]
+    self._pending = x[-1]
+    if len(points):
+      self._turn = points[-1]
+    return points
+  def _cycles(self, cycles):
+    if not cycles:
+      return (np.empty(0), np.empty(0), np.empty(0))
+    a, b, count = np.array(cycles, dtype=float).T
+    return (np.minimum(a, b), np.maximum(a, b), count)
+  def _push(self, point, cycles):
+    # Adds a turning point and counts the ranges it closes, see the class
+    # docstring. 'cycles' is appended to.
+    stack = self._stack
+    stack.append(point)
+    while len(stack) >= 3:
+      x = abs(stack[-1] - stack[-2])
+      y = abs(stack[-2] - stack[-3])
+      if x < y: break
+      if len(stack) == 3:
+        cycles.append((stack[0], stack[1], .5))
+        del stack[0]
+      else:
+        cycles.append((stack[-3], stack[-2], 1.))
+        del stack[-3:-1]
+  def feed(self, chunk):
+    cycles = []
+    for point in self._turning_points(chunk).tolist():
+      self._push(point, cycles)
+    return self._cycles(cycles)
+  def finish(self):
+    """Closes the history. Returns the cycles closed by the last sample and
+    the residue as half cycles."""
+    cycles = []
+    if self._pending is not None and self._pending != self._turn:
+      self._push(self._pending, cycles)
+    self._turn = self._pending = None
+    stack, self._stack = self._stack, []
+    return self._cycles(cycles + [(a, b, .5) for a, b in zip(stack, stack[1:])])
+
+def rainflow(chunks):
+  """Yields the (low, high, count) cycle arrays of a history given as an
+  iterable of chunks, including the residue at the end."""
+  counter = Rainflow()
+  for chunk in chunks:
+    yield counter.feed(chunk)
+  yield counter.finish()
+
+class SNCurve:
+  def __init__(self, strength, slope, knee=2e6, endurance=True, ultimate=None):
+    """
+Basquin S-N curve N = knee * (strength / amplitude)**slope, with 'strength'
+the stress amplitude endured for 'knee' cycles. With 'endurance' amplitudes
+below 'strength' cause no damage. When the 'ultimate' tensile strength is
+given, amplitudes are corrected for positive mean stresses after Goodman.
+Stresses are in Pa, or pint quantities.
+
+    """
+    self.strength = screwed_units.magnitude(strength, 'Pa')
+    self.slope = slope
+    self.knee = knee
+    self.endurance = endurance
+    self.ultimate = None if ultimate is None else screwed_units.magnitude(ultimate, 'Pa')
+  def life(self, amplitude, mean=0):
+    """Cycles to failure for arrays of stress amplitudes and means."""
+    amplitude = np.abs(np.asarray(amplitude, dtype=float))
+    if self.ultimate is not None:
+      with np.errstate(divide='ignore'):
+        amplitude = amplitude / np.clip(1 - np.maximum(mean, 0) / self.ultimate, 0, None)
+    with np.errstate(divide='ignore'):
+      life = self.knee * (self.strength / amplitude)**self.slope
+    if self.endurance:
+      life = np.where(amplitude < self.strength, np.inf, life)
+    return life
+
+class Damage:
+  """Palmgren-Miner damage sum of rainflow cycles on an S-N curve. 'factor'
+  converts the counted quantity, e.g. a load, to the stress of the curve."""
+  def __init__(self, curve, factor=1.):
+    self.curve = curve
+    self.factor = factor
+    self.damage = 0.
+    self.cycles = 0.
+  def __repr__(self):
+    return "<class '{0}.{1}'> damage {2:} ({3:} cycles)".format(self.__module__, self.__class__.__name__, self.damage, self.cycles)
+  def add(self, low, high, count):
+    low, high = self.factor * low, self.factor * high
+    life = self.curve.life((high - low) / 2, (high + low) / 2)
+    self.damage += float(np.sum(count / life))
+    self.cycles += float(np.sum(count))
+    return self
+  @property
+  def life(self):
+    """Number of repetitions of the history until failure."""
+    return 1 / self.damage if self.damage else float('inf')
+
+def thread_damage(thread, history, curve, component='m_lvonmises', column=0, chunksize=65536):
+  """
+Accumulates the fatigue damage of 'thread' for a load-time history in N,
+given as a file for read_history() or an iterable of load arrays. Load cycles
+are mapped to 'component' of Thread.stresses() through the stress per unit
+load of the thread geometry. Von Mises stresses take the sign of the load.
+Returns a Damage.
+
+  """
+  factor = float(screwed_units.magnitude(thread.stresses(1.)[component], 'Pa'))
+  if isinstance(history, str) or hasattr(history, 'read'):
+    history = read_history(history, column, chunksize)
+  damage = Damage(curve, factor)
+  for low, high, count in rainflow(history):
+    damage.add(low, high, count)
+  return damage
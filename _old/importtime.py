@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark guarding the startup budget of the package. Every run
+imports the package in a fresh interpreter, the best of a number of runs is
+compared against the budget:
+  python -m _old.importtime [budget_ms] [module ...]
+Exits with status 1 when an import exceeds the budget.
+"""
+import sys
+import subprocess
+
+__all__ = ['BUDGET', 'import_time', 'main']
+
+BUDGET = 50   # ms, for a plain 'import' of the package
+
+_SCRIPT = '''
+import time, importlib
+start = time.perf_counter()
+importlib.import_module({!r})
+print(time.perf_counter() - start)
+'''
+
+def import_time(module=__package__, repeat=5):
+  """Best import time of 'module' in seconds, over 'repeat' fresh interpreters."""
+  times = []
+  for i in range(repeat):
+    out = subprocess.run([sys.executable, '-c', _SCRIPT.format(module)],
+                         check=True, stdout=subprocess.PIPE, universal_newlines=True)
+    times.append(float(out.stdout))
+  return min(times)
+
+def main(argv=None):
+  argv = sys.argv[1:] if argv is None else argv
+  budget = float(argv[0]) if argv else BUDGET
+  status = 0
+  for module in argv[1:] or [__package__]:
+    t = 1000 * import_time(module)
+    print('{:30} {:8.1f} ms (budget {:.0f} ms)'.format(module, t, budget))
+    if t > budget:
+      status = 1
+  return status
+
+if __name__ == '__main__':
+  sys.exit(main())
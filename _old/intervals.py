@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Interval comparisons behind the Dim compare types, as array operations over
+columns of min/max bounds. All functions broadcast, so a column of measured
+parts is matched against a column of drawing tolerances, or against all of
+them with a[:, None] and b[None, :], in a single NumPy pass.
+"""
+import math
+import functools
+# NumPy is imported by the array functions, so compare_type() and thereby
+# Dim construction don't load it.
+
+__all__ = ['COMPARE_TYPES', 'compare_type', 'overlap', 'linear_fraction',
+           'normal_fraction', 'compare']
+
+# Compare types, 'linear' and 'sd' take the required overlap ratio as
+# decimals after a period, e.g. 'linear.5' or 'sd.95'.
+COMPARE_TYPES = ('exact', 'equivalent', 'linear', 'sd')
+
+def _erf(x):
+  """Error function of a float array, Abramowitz and Stegun 7.1.26. The
+  absolute error is below 1.5e-7."""
+  import numpy as np
+  a = np.abs(x)
+  t = 1 / (1 + 0.3275911*a)
+  y = 1 - t*(0.254829592 + t*(-0.284496736 + t*(1.421413741 + t*(-1.453152027 + t*1.061405429)))) * np.exp(-a*a)
+  return np.copysign(y, x)
+
+@functools.lru_cache(maxsize=None)
+def compare_type(ct):
+  """Splits a compare type into its kind and required overlap ratio, e.g.
+  'linear.5' into ('linear', 0.5). Raises a ValueError for unknown types."""
+  kind, period, digits = ct.partition('.')
+  if kind in ('exact', 'equivalent') and not period:
+    return kind, 1.0
+  if kind in ('linear', 'sd') and period and digits.isdigit():
+    return kind, float('0.' + digits)
+  raise(ValueError('Unknown compare type: \'{}\''.format(ct)))
+
+def overlap(amin, amax, bmin, bmax):
+  """Length of the intersection of the intervals a and b, 0 if disjoint."""
+  import numpy as np
+  return np.clip(np.minimum(amax, bmax) - np.maximum(amin, bmin), 0, None)
+
+def linear_fraction(amin, amax, bmin, bmax):
+  """Fraction of interval a that lies within interval b. An interval of zero
+  width, e.g. a measured value, counts as 1 inside and 0 outside b."""
+  import numpy as np
+  amin, amax, bmin, bmax = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (amin, amax, bmin, bmax)))
+  width = amax - amin
+  inside = ((amin >= bmin) & (amin <= bmax)).astype(float)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    return np.where(width > 0, overlap(amin, amax, bmin, bmax) / width, inside)
+
+def normal_fraction(mean, sd, bmin, bmax):
+  """Probability of a normal distribution (mean, sd) within interval b. A
+  standard deviation of zero counts as 1 inside and 0 outside b."""
+  import numpy as np
+  mean, sd, bmin, bmax = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (mean, sd, bmin, bmax)))
+  with np.errstate(divide='ignore', invalid='ignore'):
+    z = np.stack(((bmax - mean) / sd, (bmin - mean) / sd)) / math.sqrt(2)
+    cdf = _erf(z)
+  inside = ((mean >= bmin) & (mean <= bmax)).astype(float)
+  return np.where(sd > 0, (cdf[0] - cdf[1]) / 2, inside)
+
+def compare(amin, amax, bmin, bmax, ct='equivalent', avalue=None, bvalue=None,
+            amean=None, asd=None):
+  """
+Array version of the Dim compare types, tested in the direction of a:
+  'exact'        equal bounds and, when given, equal nominal values
+  'equivalent'   equal bounds
+  'linear.N'     at least a ratio of .N of interval a lies within b
+  'sd.N'         at least a ratio of .N of the normal distribution of a lies
+                 within b. The distribution defaults to a mean at the middle
+                 of a and a band width of 6 sigma, as for Dim contributors.
+Returns a boolean array.
+
+  """
+  import numpy as np
+  kind, ratio = compare_type(ct)
+  if kind in ('exact', 'equivalent'):
+    result = (np.asarray(amin) == bmin) & (np.asarray(amax) == bmax)
+    if kind == 'exact' and avalue is not None and bvalue is not None:
+      result &= np.asarray(avalue) == bvalue
+    return result
+  if kind == 'linear':
+    return linear_fraction(amin, amax, bmin, bmax) >= ratio
+  if amean is None: amean = (np.asarray(amin) + amax) / 2
+  if asd is None:   asd = (np.asarray(amax) - amin) / 6
+  return normal_fraction(amean, asd, bmin, bmax) >= ratio
@@ -2,9 +2,10 @@
 """
 Module containing various functions regarding ISO threads.
 """
+import re
 import math
-import pint
-from . import tolerances
+import functools
+import numpy as np
 
 class Threadf:
   def __init__(self):
@@ -45,63 +46,303 @@ def D1_base(D, H):
 def D2_base(D, H):
   return D - 2*(3/8)*H
 
-def C_max():
-  pass
+# ISO 965-1 tolerance tables, in micrometres. The tables below are the
+# printed ones, 0 where the standard gives no value. They are indexed by
+# pitch and, for the pitch diameter, by diameter range.
+PITCHES = np.array((0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.6, 0.7, 0.75, 0.8,
+                    1, 1.25, 1.5, 1.75, 2, 2.5, 3, 3.5, 4, 4.5, 5, 5.5, 6, 8))
+DIAMETER_RANGES = np.array((0.99, 1.4, 2.8, 5.6, 11.2, 22.4, 45, 90, 180, 355))
+# Tolerance grades of the external pitch diameter (d2) and major diameter (d),
+# and of the internal pitch diameter (D2) and minor diameter (D1).
+GRADES = {'d2': (3, 4, 5, 6, 7, 8, 9),
+          'D2': (4, 5, 6, 7, 8),
+          'd':  (4, 6, 8),
+          'D1': (4, 5, 6, 7, 8)}
 
+# Major diameter tolerance Td of external and minor diameter tolerance TD1 of
+# internal threads, per pitch.
+_CREST = {
+  # P        Td   4     6     8        TD1  4     5     6     7     8
+  0.2:   ((  36,   56,    0), (  38,    0,    0,    0,    0)),
+  0.25:  ((  42,   67,    0), (  45,   56,    0,    0,    0)),
+  0.3:   ((  48,   75,    0), (  53,   67,   85,    0,    0)),
+  0.35:  ((  53,   85,    0), (  63,   80,  100,    0,    0)),
+  0.4:   ((  60,   95,    0), (  71,   90,  112,    0,    0)),
+  0.45:  ((  63,  100,    0), (  80,  100,  125,    0,    0)),
+  0.5:   ((  67,  106,    0), (  90,  112,  140,  180,    0)),
+  0.6:   ((  80,  125,    0), ( 100,  125,  160,  200,    0)),
+  0.7:   ((  90,  140,    0), ( 112,  140,  180,  224,    0)),
+  0.75:  ((  90,  140,    0), ( 118,  150,  190,  236,    0)),
+  0.8:   ((  95,  150,  236), ( 125,  160,  200,  250,  315)),
+  1:     (( 112,  180,  280), ( 150,  190,  236,  300,  375)),
+  1.25:  (( 132,  212,  335), ( 170,  212,  265,  335,  425)),
+  1.5:   (( 150,  236,  375), ( 190,  236,  300,  375,  475)),
+  1.75:  (( 170,  265,  425), ( 212,  265,  335,  425,  530)),
+  2:     (( 180,  280,  450), ( 236,  300,  375,  475,  600)),
+  2.5:   (( 212,  335,  530), ( 280,  355,  450,  560,  710)),
+  3:     (( 236,  375,  600), ( 315,  400,  500,  630,  800)),
+  3.5:   (( 265,  425,  670), ( 355,  450,  560,  710,  900)),
+  4:     (( 300,  475,  750), ( 375,  475,  600,  750,  950)),
+  4.5:   (( 315,  500,  800), ( 425,  530,  670,  850, 1060)),
+  5:     (( 335,  530,  850), ( 450,  560,  710,  900, 1120)),
+  5.5:   (( 355,  560,  900), ( 475,  600,  750,  950, 1180)),
+  6:     (( 375,  600,  950), ( 500,  630,  800, 1000, 1250)),
+  8:     (( 450,  710, 1180), ( 630,  800, 1000, 1250, 1600))}
 
+# Pitch diameter tolerances Td2 of external and TD2 of internal threads, per
+# (diameter range index, pitch).
+_PITCH_DIAMETER = {
+  # range  P        Td2  3    4    5    6    7    8    9         TD2  4    5    6    7    8
+  (0, 0.2):     ((  24,   30,   38,   48,   60,   75,   95), (  40,   50,   63,   80,  100)),
+  (0, 0.25):    ((  26,   34,   42,   53,   67,   85,  106), (  45,   56,   71,   90,  112)),
+  (0, 0.3):     ((  28,   36,   45,   56,   71,   90,  112), (  48,   60,   75,   95,  118)),
+  (1, 0.2):     ((  25,   32,   40,   50,   63,   80,  100), (  42,   53,   67,   85,  106)),
+  (1, 0.25):    ((  28,   36,   45,   56,   71,   90,  112), (  48,   60,   75,   95,  118)),
+  (1, 0.35):    ((  32,   40,   50,   63,   80,  100,  125), (  53,   67,   85,  106,  132)),
+  (1, 0.4):     ((  34,   42,   53,   67,   85,  106,  132), (  56,   71,   90,  112,  140)),
+  (1, 0.45):    ((  36,   45,   56,   71,   90,  112,  140), (  60,   75,   95,  118,  150)),
+  (2, 0.35):    ((  34,   42,   53,   67,   85,  106,  132), (  56,   71,   90,  112,  140)),
+  (2, 0.5):     ((  38,   48,   60,   75,   95,  118,  150), (  63,   80,  100,  125,  160)),
+  (2, 0.6):     ((  42,   53,   67,   85,  106,  132,  170), (  71,   90,  112,  140,  180)),
+  (2, 0.7):     ((  45,   56,   71,   90,  112,  140,  180), (  75,   95,  118,  150,  190)),
+  (2, 0.75):    ((  45,   56,   71,   90,  112,  140,  180), (  75,   95,  118,  150,  190)),
+  (2, 0.8):     ((  48,   60,   75,   95,  118,  150,  190), (  80,  100,  125,  160,  200)),
+  (3, 0.75):    ((  50,   63,   80,  100,  125,  160,  200), (  85,  106,  132,  170,  212)),
+  (3, 1):       ((  56,   71,   90,  112,  140,  180,  224), (  95,  118,  150,  190,  236)),
+  (3, 1.25):    ((  60,   75,   95,  118,  150,  190,  236), ( 100,  125,  160,  200,  250)),
+  (3, 1.5):     ((  67,   85,  106,  132,  170,  212,  265), ( 112,  140,  180,  224,  280)),
+  (4, 1):       ((  60,   75,   95,  118,  150,  190,  236), ( 100,  125,  160,  200,  250)),
+  (4, 1.25):    ((  67,   85,  106,  132,  170,  212,  265), ( 112,  140,  180,  224,  280)),
+  (4, 1.5):     ((  71,   90,  112,  140,  180,  224,  280), ( 118,  150,  190,  236,  300)),
+  (4, 1.75):    ((  75,   95,  118,  150,  190,  236,  300), ( 125,  160,  200,  250,  315)),
+  (4, 2):       ((  80,  100,  125,  160,  200,  250,  315), ( 132,  170,  212,  265,  335)),
+  (4, 2.5):     ((  85,  106,  132,  170,  212,  265,  335), ( 140,  180,  224,  280,  355)),
+  (5, 1):       ((  63,   80,  100,  125,  160,  200,  250), ( 106,  132,  170,  212,  265)),
+  (5, 1.5):     ((  75,   95,  118,  150,  190,  236,  300), ( 125,  160,  200,  250,  315)),
+  (5, 2):       ((  85,  106,  132,  170,  212,  265,  335), ( 140,  180,  224,  280,  355)),
+  (5, 3):       (( 100,  125,  160,  200,  250,  315,  400), ( 170,  212,  265,  335,  425)),
+  (5, 3.5):     (( 106,  132,  170,  212,  265,  335,  425), ( 180,  224,  280,  355,  450)),
+  (5, 4):       (( 112,  140,  180,  224,  280,  355,  450), ( 190,  236,  300,  375,  475)),
+  (5, 4.5):     (( 118,  150,  190,  236,  300,  375,  475), ( 200,  250,  315,  400,  500)),
+  (6, 1.5):     ((  80,  100,  125,  160,  200,  250,  315), ( 132,  170,  212,  265,  335)),
+  (6, 2):       ((  90,  112,  140,  180,  224,  280,  355), ( 150,  190,  236,  300,  375)),
+  (6, 3):       (( 106,  132,  170,  212,  265,  335,  425), ( 180,  224,  280,  355,  450)),
+  (6, 4):       (( 118,  150,  190,  236,  300,  375,  475), ( 200,  250,  315,  400,  500)),
+  (6, 5):       (( 125,  160,  200,  250,  315,  400,  500), ( 212,  265,  335,  425,  530)),
+  (6, 5.5):     (( 132,  170,  212,  265,  335,  425,  530), ( 224,  280,  355,  450,  560)),
+  (6, 6):       (( 140,  180,  224,  280,  355,  450,  560), ( 236,  300,  375,  475,  600)),
+  (7, 2):       ((  95,  118,  150,  190,  236,  300,  375), ( 160,  200,  250,  315,  400)),
+  (7, 3):       (( 112,  140,  180,  224,  280,  355,  450), ( 190,  236,  300,  375,  475)),
+  (7, 4):       (( 125,  160,  200,  250,  315,  400,  500), ( 212,  265,  335,  425,  530)),
+  (7, 6):       (( 150,  190,  236,  300,  375,  475,  600), ( 250,  315,  400,  500,  630)),
+  (7, 8):       (( 170,  212,  265,  335,  425,  530,  670), ( 280,  355,  450,  560,  710)),
+  (8, 3):       (( 125,  160,  200,  250,  315,  400,  500), ( 212,  265,  335,  425,  530)),
+  (8, 4):       (( 140,  180,  224,  280,  355,  450,  560), ( 236,  300,  375,  475,  600)),
+  (8, 6):       (( 160,  200,  250,  315,  400,  500,  630), ( 265,  335,  425,  530,  670)),
+  (8, 8):       (( 180,  224,  280,  355,  450,  560,  710), ( 300,  375,  475,  600,  750))}
 
+# Fundamental deviations, es of external and EI of internal threads, per
+# pitch. G mirrors g, H and h are 0.
+_DEVIATIONS = {
+  # P      e     f     g
+  0.2:   (   0,    0,  -17),
+  0.25:  (   0,    0,  -18),
+  0.3:   (   0,    0,  -18),
+  0.35:  (   0,  -34,  -19),
+  0.4:   (   0,  -34,  -19),
+  0.45:  (   0,  -35,  -20),
+  0.5:   ( -50,  -36,  -20),
+  0.6:   ( -53,  -36,  -21),
+  0.7:   ( -56,  -38,  -22),
+  0.75:  ( -56,  -38,  -22),
+  0.8:   ( -60,  -38,  -24),
+  1:     ( -60,  -40,  -26),
+  1.25:  ( -63,  -42,  -28),
+  1.5:   ( -67,  -45,  -32),
+  1.75:  ( -71,  -48,  -34),
+  2:     ( -71,  -52,  -38),
+  2.5:   ( -80,  -58,  -42),
+  3:     ( -85,  -63,  -48),
+  3.5:   ( -90,  -70,  -53),
+  4:     ( -95,  -75,  -60),
+  4.5:   (-100,  -80,  -63),
+  5:     (-106,  -85,  -71),
+  5.5:   (-112,  -90,  -75),
+  6:     (-118,  -95,  -80),
+  8:     (-140, -118, -100)}
 
-def tolerance(P, ):
-  pass
+def _tables():
+  """Indexed arrays of the tables above: tolerances per (kind, grade), with
+  the pitch as first and the diameter range as second index, and deviations
+  per position. Missing values are NaN."""
+  p = {P: i for i, P in enumerate(PITCHES.tolist())}
+  grades = {}
+  for kind, column in (('d', 0), ('D1', 1)):
+    table = np.zeros((len(GRADES[kind]), len(PITCHES)))
+    for P, row in _CREST.items():
+      table[:, p[P]] = row[column]
+    grades.update(((kind, g), t) for g, t in zip(GRADES[kind], table))
+  for kind, column in (('d2', 0), ('D2', 1)):
+    table = np.zeros((len(GRADES[kind]), len(PITCHES), len(DIAMETER_RANGES) - 1))
+    for (r, P), row in _PITCH_DIAMETER.items():
+      table[:, p[P], r] = row[column]
+    grades.update(((kind, g), t) for g, t in zip(GRADES[kind], table))
+  deviations = np.array([_DEVIATIONS[P] for P in PITCHES.tolist()], dtype=float).T
+  deviations = {'e': deviations[0], 'f': deviations[1], 'g': deviations[2],
+                'G': -deviations[2], 'h': np.zeros(len(PITCHES)), 'H': np.zeros(len(PITCHES))}
+  for table in list(grades.values()) + [deviations['e'], deviations['f']]:
+    table[table == 0] = np.nan
+  return grades, deviations
 
+_GRADE_TABLES, _DEVIATION_TABLES = _tables()
 
-def eviation():
-  pass
+def _defined(values, what):
+  if np.any(np.isnan(values)):
+    raise(ValueError('{} not in ISO 965-1 tables.'.format(what)))
+  return values
 
+def _pitch_index(P):
+  P = np.asarray(P, dtype=float)
+  i = np.clip(np.searchsorted(PITCHES, P), 0, len(PITCHES) - 1)
+  if not np.all(np.isclose(PITCHES[i], P)):
+    raise(ValueError('Pitch not in ISO 965-1: {}'.format(np.asarray(P)[~np.isclose(PITCHES[i], P)].flat[0])))
+  return i
+
+def _range_index(D):
+  D = np.asarray(D, dtype=float)
+  if np.any((D <= DIAMETER_RANGES[0]) | (D > DIAMETER_RANGES[-1])):
+    raise(ValueError('Diameter outside the ISO 965-1 ranges of {} to {} mm.'.format(DIAMETER_RANGES[0], DIAMETER_RANGES[-1])))
+  return np.searchsorted(DIAMETER_RANGES, D) - 1
+
+def tolerance(P, grade, kind='d2', D=None):
+  """tolerance(P, grade, kind='d2', D=None)
+  Tolerance in micrometres of tolerance 'grade' for pitch 'P' in mm, from the
+  printed tables of the standard. 'kind' is
+  one of GRADES: 'd2' and 'D2' for the external and internal pitch diameter,
+  which also need the nominal diameter 'D', 'd' for the external major
+  diameter and 'D1' for the internal minor diameter. Accepts arrays.
+"""
+  try:
+    table = _GRADE_TABLES[(kind, grade)]
+  except KeyError:
+    raise(ValueError('No tolerance grade {} for \'{}\'.'.format(grade, kind)))
+  if kind in ('d2', 'D2'):
+    return _defined(table[_pitch_index(P), _range_index(D)], 'Tolerance')
+  return _defined(table[_pitch_index(P)], 'Tolerance')
+
+def deviation(P, position):
+  """deviation(P, position)
+  Fundamental deviation in micrometres of tolerance 'position' for pitch 'P'
+  in mm: es of external ('e', 'f', 'g', 'h') or EI of internal ('G', 'H')
+  threads. Accepts arrays.
+"""
+  try:
+    return _defined(_DEVIATION_TABLES[position][_pitch_index(P)], 'Deviation')
+  except KeyError:
+    raise(ValueError('Unknown tolerance position: \'{}\''.format(position)))
+
+_TOLERANCE_CLASS = re.compile("([3-9])([efghGH])(?:([3-9])([efghGH]))?$")
+
+@functools.lru_cache(maxsize=None)
+def _tolerance_class(tc):
+  # '5g6g' -> ((5, 'g'), (6, 'g')), '6H' -> ((6, 'H'), (6, 'H'))
+  match = _TOLERANCE_CLASS.match(tc.strip())
+  if match is None or (match.group(4) and match.group(2).isupper() != match.group(4).isupper()):
+    raise(ValueError('Not a tolerance class: \'{}\''.format(tc)))
+  pg, pp, cg, cp = match.groups()
+  return ((int(pg), pp), (int(cg or pg), cp or pp))
+
+def limits(D, P, tc):
+  """limits(D, P, tc)
+  Limits of size in mm of threads with nominal diameters 'D', pitches 'P' and
+  tolerance classes 'tc' like '6g', '5g6g' or '6H', for a whole batch of
+  threads in one call. Arguments are scalars or equal length arrays. Returns a
+  dictionary of arrays: major_min, major_max, pitch_min, pitch_max,
+  minor_min and minor_max. Limits not specified by ISO 965-1, the maximum
+  major diameter of internal and the minimum minor diameter of external
+  threads, are NaN.
+"""
+  D, P, tc = np.broadcast_arrays(np.asarray(D, dtype=float), np.asarray(P, dtype=float), np.asarray(tc))
+  pi, ri = _pitch_index(P), _range_index(D)
+  names, inverse = np.unique(tc, return_inverse=True)
+  inverse = inverse.reshape(tc.shape)
+  Tpitch, Tcrest, dev = (np.empty(D.shape) for i in range(3))
+  internal = np.empty(D.shape, dtype=bool)
+  for n, name in enumerate(names):
+    rows = inverse == n
+    (pg, pp), (cg, cp) = _tolerance_class(str(name))
+    inner = pp.isupper()
+    try:
+      Tpitch[rows] = _GRADE_TABLES[('D2' if inner else 'd2', pg)][pi[rows], ri[rows]]
+      Tcrest[rows] = _GRADE_TABLES[('D1' if inner else 'd', cg)][pi[rows]]
+    except KeyError:
+      raise(ValueError('Tolerance grade not in ISO 965-1: \'{}\''.format(name)))
+    dev[rows] = _DEVIATION_TABLES[pp][pi[rows]]
+    internal[rows] = inner
+  for values in (Tpitch, Tcrest, dev):
+    _defined(values, 'Tolerance class')
+  Tpitch, Tcrest, dev = Tpitch / 1000, Tcrest / 1000, dev / 1000
+  h = H(P)
+  pitch_low = np.where(internal, D2_base(D, h) + dev, D2_base(D, h) + dev - Tpitch)
+  nan = np.full(D.shape, np.nan)
+  return {'major_min': np.where(internal, D + dev, D + dev - Tcrest),
+          'major_max': np.where(internal, nan, D + dev),
+          'pitch_min': pitch_low,
+          'pitch_max': pitch_low + Tpitch,
+          'minor_min': np.where(internal, D1_base(D, h) + dev, nan),
+          'minor_max': np.where(internal, D1_base(D, h) + dev + Tcrest, D - 2*(17/24)*h + dev)}
+
+def C_max(P, Td2):
+  """Maximum root truncation of external threads with the minimum root radius,
+  for pitch 'P' and pitch diameter tolerance 'Td2' in the same unit."""
+  R = R_min(P)
+  return H(P)/4 - R*(1 - np.cos(np.pi/3 - np.arccos(1 - Td2/(4*R)))) + Td2/2
 
 def C_min(Pitch):
   return (1/8)*Pitch
 
 def R_min(Pitch):
-  return 
+  """Minimum root radius of external threads."""
+  return 0.125*Pitch
 
-def Desgn2Params(designation):
-  """Desgn2Params(designation)
-  Converts a thread designation according to ISO 965-1:2013, chapter 12, to its
-  individual components. Returns a dictionary containing the values within the
-  ISO string. Decoding is not strict. Will process "M10 × 1.5 - 7H/7g6g" as well
-  as the non-conform "m8 X ph2,5p1,25(two starts) - 7H / 7g".
-  
-  Will extract:
-    diameter, lead, pitch, tolerances, engagement, handedness.
-"""
-  def _2num(s):
-    if s == None:
-      return None
-    else:
-      try:
-        return int(s.replace(',', '.'))
-      except ValueError:
-        return float(s.replace(',', '.'))
-      except:
-        raise
-  
-  def _2uc(s):
-    if s == None:
-      return None
-    else:
-      try:
-        return s.upper()
-      except:
-        raise
-  
-  matchpattern = ("(?:[Mm]([0-9]+[.,]?[0-9]*))" +
-                  "(?:[ ]*[xX×][ ]*(?:(?:[Pp][Hh])?([0-9]+[.,]?[0-9]*)[Pp]([0-9]+[.,]?[0-9]*))(?:[ ]*[(][a-zA-Z ]+[)])?)?" +
-                  "(?:[ ]*[xX×][ ]*([0-9]+[.,]?[0-9]*))?" +
-                  "(?:[ ]*[-][ ]*(?:([0-9]+[A-Z])?([0-9]+[A-Z])?[ /]*([0-9]+[a-z])?([0-9]+[a-z])?))?" +
-                  "(?:[ ]*[-][ ]*([SsNnLl]))?" +
-                  "(?:[ ]*[-][ ]*([Ll][Hh]))?")
-  li = list(re.search(matchpattern, designation).groups())
+class DesignationError(ValueError):
+  """Raised when a thread or tolerance designation cannot be decoded. The
+  offending string is available as 'designation', the cause as 'reason'."""
+  def __init__(self, designation, reason):
+    self.designation = designation
+    self.reason = reason
+    super().__init__('{}: {!r}'.format(reason, designation))
+
+_DESIGNATION = re.compile("(?:[Mm]([0-9]+[.,]?[0-9]*))" +
+                          "(?:[ ]*[xX×][ ]*(?:(?:[Pp][Hh])?([0-9]+[.,]?[0-9]*)[Pp]([0-9]+[.,]?[0-9]*))(?:[ ]*[(][a-zA-Z ]+[)])?)?" +
+                          "(?:[ ]*[xX×][ ]*([0-9]+[.,]?[0-9]*))?" +
+                          "(?:[ ]*[-][ ]*(?:([0-9]+[A-Z])?([0-9]+[A-Z])?[ /]*([0-9]+[a-z])?([0-9]+[a-z])?))?" +
+                          "(?:[ ]*[-][ ]*([SsNnLl]))?" +
+                          "(?:[ ]*[-][ ]*([Ll][Hh]))?")
+
+def _2num(s):
+  if s == None:
+    return None
+  else:
+    try:
+      return int(s.replace(',', '.'))
+    except ValueError:
+      return float(s.replace(',', '.'))
+
+def _2uc(s):
+  if s == None:
+    return None
+  else:
+    return s.upper()
+
+@functools.lru_cache(maxsize=65536)
+def _parse(designation):
+  """Cached worker of Desgn2Params(). Returns the parameters as a tuple of
+  (key, value) pairs, so cached results cannot be modified by the caller."""
+  match = _DESIGNATION.search(designation)
+  if match is None:
+    raise(DesignationError(designation, 'Not a thread designation'))
+  li = match.groups()
   params = {}
   params['Diameter'] = _2num(li[0])
   params['Lead'] = _2num(li[1])
@@ -120,15 +361,49 @@ def Desgn2Params(designation):
   if _2uc(li[9]) == 'LH': params['LeftHandedness'] = True
   else:                   params['LeftHandedness'] = False
   
+  if params['Pitch'] != None:
+    if params['Pitch'] == 0:
+      raise(DesignationError(designation, 'Pitch should be larger than zero'))
+    if not (params['Lead']/params['Pitch']).is_integer():
+      raise(DesignationError(designation, 'Incorrect lead value for pitch. Should be exact multiple'))
   
-  try:
-    N_leads = (params['Lead']/params['Pitch']).is_integer()
-    if not N_leads:
-      raise(ValueError('Incorrect lead value for pitch. Should be exact multiple.'))
-  except:
-    raise
+  return tuple(params.items())
+
+def Desgn2Params(designation):
+  """Desgn2Params(designation)
+  Converts a thread designation according to ISO 965-1:2013, chapter 12, to its
+  individual components. Returns a dictionary containing the values within the
+  ISO string. Decoding is not strict. Will process "M10 × 1.5 - 7H/7g6g" as well
+  as the non-conform "m8 X ph2,5p1,25(two starts) - 7H / 7g".
   
-  return params
+  Will extract:
+    diameter, lead, pitch, tolerances, engagement, handedness.
+  
+  Raises DesignationError when the string cannot be decoded. Results are
+  cached, so repeated designations are only parsed once.
+"""
+  return dict(_parse(designation))
+
+def parse_many(designations, errors='raise'):
+  """parse_many(designations, errors='raise')
+  Lazily decodes an iterable of designations, yielding one parameter dictionary
+  per string. 'errors' selects what happens to undecodable strings:
+    'raise'  raise the DesignationError
+    'yield'  yield the DesignationError in place of the dictionary
+    'skip'   leave the string out
+"""
+  # Checked here rather than in the generator, so a bad value raises at the call.
+  if errors not in ('raise', 'yield', 'skip'):
+    raise(ValueError('Illegal value provided for \'errors\' variable.'))
+  return _parse_many(designations, errors)
+
+def _parse_many(designations, errors):
+  for designation in designations:
+    try:
+      yield Desgn2Params(designation)
+    except DesignationError as e:
+      if errors == 'raise': raise
+      elif errors == 'yield': yield e
 
 def Params2Desgn(Diameter, Pitch, Lead,
                  IntPitchTolerance, IntMinorTolerance,
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Preferred numbers module"""
 import math
+import array
 import bisect
+import numpy as np
 from decimal import *
 
 ROUNDSTYLE='linear' # or 'logarithmic'
@@ -77,6 +79,32 @@ _pref = {"R3":    ['1'   , '2'   , '5'   ],
                    '1.18', '1.43', '1.74', '2.10', '2.55', '3.09', '3.74', '4.53', '5.49', '6.65', '8.06', '9.76',
                    '1.20', '1.45', '1.76', '2.13', '2.58', '3.12', '3.79', '4.59', '5.56', '6.73', '8.16', '9.88']}
 
+# Series parsed once into sorted tables. E-series are listed column-wise above,
+# so sorting is required for bisection. Series of integers, e.g. R3, keep
+# integer numbers.
+_FLOAT   = {k: array.array('d', sorted(set(float(x) for x in v))) for k, v in _pref.items()}
+_DECIMAL = {k: tuple(sorted(set(Decimal(x) for x in v)))          for k, v in _pref.items()}
+_INTEGER = {k: tuple(sorted(set(int(x) for x in v)))              for k, v in _pref.items()
+            if all(x.isdigit() for x in v)}
+
+def _table(value, series):
+  """Returns the sorted table of 'series' matching the type of 'value'."""
+  if isinstance(value, Decimal): return _DECIMAL[series]
+  elif series in _INTEGER:       return _INTEGER[series]
+  else:                          return _FLOAT[series]
+
+def _normalize(value):
+  """Splits a positive value into its decade power and normalized value 1 <= n < 10."""
+  if isinstance(value, Decimal):
+    power = value.adjusted()
+    return power, value.scaleb(-power)
+  power = math.floor(math.log10(value))
+  normalized = value / (10**power)
+  # log10 may be off by one ulp around exact powers of ten.
+  if normalized >= 10: power, normalized = power + 1, normalized / 10
+  elif normalized < 1: power, normalized = power - 1, normalized * 10
+  return power, normalized
+
 class Num:
   def __init__(self, value, series, roundhalf='even', roundstyle='logarithmic'):
     """Initialization function, sets up the basic variables, and calls calculate()"""
@@ -86,17 +114,8 @@ class Num:
     self._roundstyle = roundstyle
     self.calculate()
   def calculate(self):
-    if isinstance(self.value, Decimal):
-      self._numlist = [Decimal(x) for x in _pref[self.series]]
-      self.power = math.floor(self.value.log10())
-      self.normalized = self.value / (10**self.power)
-    else:
-      try:
-        self._numlist = [int(x) for x in _pref[self.series]]
-      except ValueError:
-        self._numlist = [float(x) for x in _pref[self.series]]
-      self.power = math.floor(math.log10(self.value))
-      self.normalized = self.value / (10**self.power)
+    self._numlist = _table(self.value, self.series)
+    self.power, self.normalized = _normalize(self.value)
     # 
     # !!!!!!!
     # Still need to implement differences between halfway rounding patterns here.
@@ -109,9 +128,7 @@ class Num:
       if self._roundhalf=='from_zero': pass
       if self._roundhalf=='even': pass
     self.number_id = number_id(self.normalized, self._numlist, roundstyle=self._roundstyle)
-    self.number = self._numlist[self.number_id]*10**self.power
-    if isinstance(self.value, Decimal):
-      pass
+    self.number = _number(self._numlist, self.number_id, self.power)
 
 def find_lt(a, x):
     'Find rightmost value less than x'
@@ -120,27 +137,68 @@ def find_lt(a, x):
         return i-1, a[i-1]
     raise ValueError
 
+def _number(series, number_id, power):
+  """Scales the series number at 'number_id' to decade 'power'. An id equal to
+  the series length refers to the first number of the next decade."""
+  if number_id == len(series):
+    number_id, power = 0, power + 1
+  if isinstance(series[number_id], Decimal):
+    return series[number_id].scaleb(power)
+  if power < 0:
+    return series[number_id] / 10**-power
+  return series[number_id] * 10**power
+
 def number_id(value, series, roundstyle='log'):
-  if value in series:
-    return series.index(value)
-  elif roundstyle.startswith('lin'):
-    low_id, low = find_lt(series, value)
-    if low_id == len(series):
-      high = series[0]*10
-    else:
-      high = series[low_id+1]
-    a = (high-low)/1
-    b = low-low_id*a
-    if isinstance(value, Decimal):
-      return int(((value-b)/a).to_integral())
-    else:
-      return round((value-b)/a)
+  """Index of the number in sorted 'series' nearest to normalized 'value'
+  (1 <= value < 10), found by bisection. Returns len(series) when the first
+  number of the next decade is nearest. 'series' may also be a series name.
+  Halfway cases round to the even index."""
+  if isinstance(series, str):
+    series = _table(value, series)
+  i = bisect.bisect_left(series, value)
+  if i < len(series) and series[i] == value:
+    return i
+  if i == 0:
+    return 0
+  low = series[i-1]
+  high = series[i] if i < len(series) else series[0]*10
+  if roundstyle.startswith('lin'):
+    below, above = value - low, high - value
   elif roundstyle.startswith('log'):
-    logbase = 10**(1/len(series))
-    if isinstance(value, Decimal):
-      return int((value.ln() / Decimal(math.log(logbase))).to_integral())
-    else:
-      return round(math.log2(value) / math.log2(logbase))
+    # Compares the logarithmic distances without taking logarithms.
+    below, above = value * value, low * high
   else:
     raise(ValueError('Illegal value provided for \'roundstyle\' variable.'))
+  if below > above or (below == above and i % 2 == 0):
+    return i
+  return i-1
 
+def snap(value, series, roundstyle='log'):
+  """Rounds a positive value to the nearest number of a preferred number series."""
+  power, normalized = _normalize(value)
+  table = _table(value, series)
+  return _number(table, number_id(normalized, table, roundstyle), power)
+
+def round_to_series(values, series, style='log'):
+  """Array version of snap(). Rounds every value of an array to the nearest
+  number of a preferred number series in one pass. Values that are not
+  positive yield NaN."""
+  values = np.asarray(values, dtype=float)
+  table = np.frombuffer(_FLOAT[series], dtype=float)
+  ext = np.append(table, table[0]*10)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    power = np.floor(np.log10(values))
+    normalized = values / 10**power
+    # log10 may be off by one ulp around exact powers of ten.
+    power = np.where(normalized >= 10, power + 1, np.where(normalized < 1, power - 1, power))
+    normalized = values / 10**power
+  i = np.clip(np.searchsorted(table, normalized, side='right'), 1, len(table))
+  low, high = ext[i-1], ext[i]
+  if style.startswith('lin'):
+    below, above = normalized - low, high - normalized
+  elif style.startswith('log'):
+    below, above = normalized * normalized, low * high
+  else:
+    raise(ValueError('Illegal value provided for \'style\' variable.'))
+  index = np.where((below > above) | ((below == above) & (i % 2 == 0)), i, i-1)
+  return np.where(values > 0, ext[index] * 10**power, np.nan)
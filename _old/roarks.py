@@ -1,6 +1,7 @@
 #!/usr/bin/env python3.5
 import math
 import warnings
+import numpy as np
 
 def von_mises(sx=0, sy=0, sz=0, txy=0, tyz=0, txz=0):
   """This function calculates the Von Mises yield criterion from the three principal
@@ -9,6 +10,21 @@ def von_mises(sx=0, sy=0, sz=0, txy=0, tyz=0, txz=0):
 
 
 class Tube:
+  __slots__ = ('__rext', '__rint', '__wt', '__len', '__mat', '__pext', '__pint',
+               '__fax', '__tax', '__trad', '__capped', '__dimorder', '__dimlock',
+               '__lamecache', '__section')
+  ALIASES = {'re' : 'radius_external',
+             'ri' : 'radius_internal',
+             'de' : 'diameter_external',
+             'di' : 'diameter_internal',
+             'w'  : 'wallthickness',
+             'l'  : 'length',
+             'mat': 'material',
+             'pe' : 'pressure_external',
+             'pi' : 'pressure_internal',
+             'fa' : 'force_axial',
+             'ta' : 'torsion_axial',
+             'tr' : 'torsion_radial'}
   def __init__(self):
     self.__rext     = None     # external radius
     self.__rint     = None     # internal radius
@@ -21,20 +37,10 @@ class Tube:
     self.__tax      = None     # axial torsion
     self.__trad     = None     # radial torsion
     self.__capped   = None     # capped tube, e.g. pressure vessel
-    self.__dimorder = []       # order at which radial dimensions are provided
+    self.__dimorder = ()       # order at which radial dimensions are provided
     self.__dimlock  = None
-    self.__aliases  = {'re' : 'radius_external',
-                       'ri' : 'radius_internal',
-                       'de' : 'diameter_external',
-                       'di' : 'diameter_internal',
-                       'w'  : 'wallthickness',
-                       'l'  : 'length',
-                       'mat': 'material',
-                       'pe' : 'pressure_external',
-                       'pi' : 'pressure_internal',
-                       'fa' : 'force_axial',
-                       'ta' : 'torsion_axial',
-                       'tr' : 'torsion_radial'}
+    self.__lamecache = None    # geometry factors of stress_pressure()
+    self.__section  = None     # section properties, see __sections()
   def buckling_underpressure(self):
     w = (((3 * (self.pressure_external - self.pressure_internal) * 
            self.radius_external**3) / self.material.youngs_modulus)**(1/3))
@@ -45,34 +51,55 @@ class Tube:
           ((4 * self.force_axial * self.length**2) /
            (math.pi**3 * self.material.youngs_modulus)))**(1/4))
     return self.wallthickness / w
-  def stress_pressure(self):
-    """Determines the individual stress components due to internal or external pressure."""
-    # gets s1, s2, s3, t1 for the inner and outer edge of the tube
-      if self.pressure_external < self.pressure_internal: #internal pressure
-        if self.capped:
-          s1 = ((self.pressure_net * self.radius_internal ** 2) / 
-                (self.radius_external**2 - self.radius_internal**2))
-        else:
-          s1 = 0
-        s2i = ((self.pressure_net * self.radius_internal**2 * (self.radius_external**2 + self.radius_internal**2)) /
-               (self.radius_internal**2 * (self.radius_external**2 - self.radius_internal**2)))
-        s2e = ((self.pressure_net * self.radius_internal**2 * (self.radius_external**2 + self.radius_external**2)) /
-               (self.radius_external**2 * (self.radius_external**2 - self.radius_internal**2)))
-        s3i = ((-1 * self.pressure_net * self.radius_internal**2 * (self.radius_external**2 - self.radius_internal**2)) /
-               (self.radius_internal**2 * (self.radius_external**2 - self.radius_internal**2)))
-        s3e = ((-1 * self.pressure_net * self.radius_internal**2 * (self.radius_external**2 - self.radius_internal**2)) /
-               (self.radius_internal**2 * (self.radius_external**2 - self.radius_internal**2)))
-        
-      
-      elif self.pressure_external > self.pressure_internal:
-        if self.capped:
-          s1 = ((self.pressure_net * self.radius_external ** 2) / 
-                (self.radius_external**2 - self.radius_internal**2))
-        else:
-          s1 = 0
-      else: pass
-      
-    return None
+  def __invalidate(self):
+    # Drops the cached geometry after a change of the radial dimensions.
+    self.__lamecache = None
+    self.__section   = None
+  def __sections(self):
+    """Section properties, calculated once and cached until a radius changes."""
+    if self.__section is None:
+      re2, ri2 = self.radius_external**2, self.radius_internal**2
+      # (area_wall, area_core, area_total, Ix, Iz)
+      self.__section = (math.pi * (re2 - ri2),
+                        math.pi * ri2,
+                        math.pi * re2,
+                        (math.pi / 4) * (re2**2 - ri2**2),
+                        (math.pi / 2) * (re2**2 - ri2**2))
+    return self.__section
+  def __lame(self):
+    """Geometry-only factors of the Lamé equations, cached until a radius changes."""
+    if self.__lamecache is None:
+      a2 = self.radius_internal**2
+      b2 = self.radius_external**2
+      self.__lamecache = {'a2': a2, 'b2': b2,
+                          'k':   1 / (b2 - a2),      # 1 / (b² - a²)
+                          'kab': a2 * b2 / (b2 - a2)} # a²b² / (b² - a²)
+    return self.__lamecache
+  def stress_pressure(self, r=None):
+    """Determines the radial, hoop and axial stress due to internal and external
+    pressure with the Lamé equations, at radius or array of radii 'r'. Defaults
+    to the inner and outer edge of the tube. Returns a dictionary of arrays with
+    keys 'radial', 'hoop' and 'axial'. The axial stress is that of a capped tube,
+    or zero if uncapped. Undefined pressures are taken as zero, an undefined
+    'capped' as uncapped."""
+    g = self.__lame()
+    if r is None:
+      ri, re = self.radius_internal, self.radius_external
+      if hasattr(ri, 'units'):
+        r = np.array([ri.magnitude, re.to(ri.units).magnitude]) * ri.units
+      else:
+        r = np.array([ri, re], dtype=float)
+    elif not hasattr(r, 'units'):
+      r = np.asarray(r, dtype=float)
+    # An undefined pressure takes the units of the other one.
+    pi, pe = self.pressure_internal, self.pressure_external
+    if pi is None: pi = 0 * pe if pe is not None else 0
+    if pe is None: pe = 0 * pi
+    A = (pi * g['a2'] - pe * g['b2']) * g['k']
+    B = (pi - pe) * g['kab']
+    return {'radial': A - B / r**2,
+            'hoop':   A + B / r**2,
+            'axial':  (A if self.__capped is True else 0 * A) + 0 * (B / r**2)}
   def stress_tension(self):
     """Determines the individual stress components due to longitudinal tension."""
     pass
@@ -92,7 +119,7 @@ class Tube:
     dims = {'radius_external': self.__rext,
             'radius_internal': self.__rint,
             'wallthickness':   self.__wt}
-    do = self.__dimorder[:]
+    do = list(self.__dimorder)
     dl = self.__dimlock
     me = propname
     if len(do) < 2:
@@ -127,7 +154,8 @@ class Tube:
     self.__rint = dims['radius_internal']
     self.__wt   = dims['wallthickness']
     self.__dimlock  = dl
-    self.__dimorder = do[:]
+    self.__dimorder = tuple(do)
+    self.__invalidate()
   
   if True:    # define base properties
     if True:  # property radius_external
@@ -145,7 +173,8 @@ class Tube:
       @radius_external.deleter
       def radius_external(self):
         self.__rext = None
-        if 'radius_external' in self.__dimorder: self.__dimorder.remove('radius_external')
+        self.__dimorder = tuple(x for x in self.__dimorder if x != 'radius_external')
+        self.__invalidate()
     if True:  # property radius_internal
       @property
       def radius_internal(self):
@@ -161,7 +190,8 @@ class Tube:
       @radius_internal.deleter
       def radius_internal(self):
         self.__rint = None
-        if 'radius_internal' in self.__dimorder: self.__dimorder.remove('radius_internal')
+        self.__dimorder = tuple(x for x in self.__dimorder if x != 'radius_internal')
+        self.__invalidate()
     if True:  # property wallthickness
       @property
       def wallthickness(self):
@@ -177,7 +207,8 @@ class Tube:
       @wallthickness.deleter
       def wallthickness(self):
         self.__wt = None
-        if 'wallthickness' in self.__dimorder: self.__dimorder.remove('wallthickness')
+        self.__dimorder = tuple(x for x in self.__dimorder if x != 'wallthickness')
+        self.__invalidate()
     if True:  # property length
       @property
       def length(self):                 return self.__len
@@ -233,7 +264,7 @@ class Tube:
         return self.__dimlock
       @dimlock.setter
       def dimlock(self, name):
-        name = self.__aliases.get(name, name)
+        name = self.ALIASES.get(name, name)
         if name in ('radius_external', 'radius_internal', 'wallthickness'):
           self.__dimlock = name
         else:
@@ -277,20 +308,20 @@ class Tube:
         return self.pressure_internal - self.pressure_external
     if True:  # cross-sectional area of cylinder wall
       @property
-      def area_wall(self):  return math.pi * (self.radius_external**2 - self.radius_internal**2)
+      def area_wall(self):  return self.__sections()[0]
     if True:  # cross-sectional area of cylinder inside
       @property
-      def area_core(self):  return math.pi * self.radius_internal**2
+      def area_core(self):  return self.__sections()[1]
     if True:  # cross-sectional area of total cylinder
       @property
-      def area_total(self): return math.pi * self.radius_external**2
+      def area_total(self): return self.__sections()[2]
     if True:  # second moment of area
       @property
-      def Ix(self): return (math.pi / 4) * (self.radius_external**4 - self.radius_internal**4)
+      def Ix(self): return self.__sections()[3]
       @property
       def Iy(self): return self.Ix
       @property
-      def Iz(self): return (math.pi / 2) * (self.radius_external**4 - self.radius_internal**4)
+      def Iz(self): return self.__sections()[4]
   
       
   
@@ -329,4 +360,55 @@ class Tube:
       
       
     
-      
\ No newline at end of file
+      
+def screen(radius_external=None, radius_internal=None, wallthickness=None,
+           pressure_internal=0, pressure_external=0, force_axial=0, length=None,
+           youngs_modulus=None, yield_strength=None, capped=False):
+  """Screens arrays of tube geometries against pressure and axial force in one
+  vectorized pass. Provide two out of the three radial dimensions; all
+  arguments broadcast against each other. Returns a dictionary of arrays:
+    'radius_external', 'radius_internal', 'wallthickness'
+    'vonmises_internal', 'vonmises_external', 'vonmises'  (maximum of both)
+    'sf_vonmises'                  if yield_strength is given
+    'buckling_underpressure'       if youngs_modulus is given
+    'buckling_longitudinal_force'  if youngs_modulus and length are given
+  With 'capped' the axial stress of closed ends is added, as for Tube.capped.
+  Tubes are uncapped by default, like a Tube without 'capped'.
+  Buckling safety factors follow Tube.buckling_underpressure() and
+  Tube.buckling_longitudinal_force(), so a positive axial force is compressive.
+  They are inf when the load cannot buckle the tube and NaN when the formula
+  has no solution."""
+  if sum(x is None for x in (radius_external, radius_internal, wallthickness)) != 1:
+    raise(ValueError('Provide exactly two out of three radial dimensions.'))
+  if radius_external is None:   radius_external = np.add(radius_internal, wallthickness)
+  elif radius_internal is None: radius_internal = np.subtract(radius_external, wallthickness)
+  else:                         wallthickness   = np.subtract(radius_external, radius_internal)
+  re, ri, wt, pi, pe, fa = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in
+    (radius_external, radius_internal, wallthickness, pressure_internal, pressure_external, force_axial)])
+  if np.any((wt <= 0) | (ri < 0)):
+    raise(ValueError('Impossible dimensional parameters provided'))
+  a2, b2 = ri**2, re**2
+  A = (pi * a2 - pe * b2) / (b2 - a2)
+  B = (pi - pe) * b2             # a²b²/(b²-a²) / r², with r = a at the inner wall
+  area_wall = np.pi * (b2 - a2)
+  axial = (A if capped else 0) - fa / area_wall
+  inner = von_mises(sx=A - B / (b2 - a2), sy=A + B / (b2 - a2), sz=axial)
+  outer = von_mises(sx=A - (pi - pe) * a2 / (b2 - a2), sy=A + (pi - pe) * a2 / (b2 - a2), sz=axial)
+  result = {'radius_external':   re,
+            'radius_internal':   ri,
+            'wallthickness':     wt,
+            'vonmises_internal': inner,
+            'vonmises_external': outer,
+            'vonmises':          np.maximum(inner, outer)}
+  if yield_strength is not None:
+    with np.errstate(divide='ignore'):
+      result['sf_vonmises'] = yield_strength / result['vonmises']
+  if youngs_modulus is not None:
+    with np.errstate(divide='ignore', invalid='ignore'):
+      w = np.cbrt((3 * (pe - pi) * re**3) / youngs_modulus)
+      result['buckling_underpressure'] = np.where(pe > pi, wt / w, np.inf)
+      if length is not None:
+        w = re - (re**4 - ((4 * fa * np.asarray(length, dtype=float)**2) /
+                           (np.pi**3 * youngs_modulus)))**(1/4)
+        result['buckling_longitudinal_force'] = np.where(fa > 0, wt / w, np.inf)
+  return result
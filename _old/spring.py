@@ -3,26 +3,38 @@
 import os
 import sys
 import math
-import pint
-import utils
+import functools
+import itertools
+import numpy as np
+from . import units
+from . import tables
+from . import sweep
 from collections import OrderedDict
-import traceback
+import warnings
 
-u = pint.UnitRegistry()
 
-
-E = u('205 GPa')   # Modulus of Elasticity
-G = u(' 80 GPa')   # Modulus of Rigidity
 v = 0.28           # Poisson's ratio
-s = u('978 MPa')   # Young's modulus
-H = u('70 mm')     # Effective spring range
-
-D = u('80 mm')
-w = u(' 5 mm')
-h = u('10 mm')
-P = u('25 kN')
 n = 5
 
+# Example quantities, built on first use in the shared registry 'u'.
+_QUANTITIES = {
+  'E': '205 GPa',    # Modulus of Elasticity
+  'G': ' 80 GPa',    # Modulus of Rigidity
+  's': '978 MPa',    # Young's modulus
+  'H': '70 mm',      # Effective spring range
+  'D': '80 mm',
+  'w': ' 5 mm',
+  'h': '10 mm',
+  'P': '25 kN'}
+
+def __getattr__(name):
+  # The module level registry 'u' is the shared one, built on first use.
+  if name == 'u':
+    return units.registry()
+  if name in _QUANTITIES:
+    return units.registry()(_QUANTITIES[name])
+  raise(AttributeError('module \'{}\' has no attribute \'{}\''.format(__name__, name)))
+
 
 # Notational conversion for Roarks'
 
@@ -48,17 +60,70 @@ if True:     # x property
 #      raise AttributeError('\'_x\' property cannot be explicitly deleted.')
   pass
 
-def whoami():
-  return traceback.extract_stack()[-3][2]
+# Relations between the spring parameters, as (target, inputs, function). For
+# every target the relations are listed in order of preference.
+_RELATIONS = (
+  ("mean_diameter",     ("external_diameter", "wire_width"),    lambda ed, ww: ed - ww),
+  ("mean_diameter",     ("internal_diameter", "wire_width"),    lambda id, ww: id + ww),
+  ("mean_diameter",     ("coil_pitch", "coil_angle"),           lambda cp, ca: cp / (math.pi * math.tan(ca))),
+  ("mean_diameter",     ("height", "coil_count", "coil_angle"), lambda h, cc, ca: h / (math.pi * cc * math.tan(ca))),
+  ("external_diameter", ("mean_diameter", "wire_width"),        lambda md, ww: md + ww),
+  ("external_diameter", ("internal_diameter", "wire_width"),    lambda id, ww: id + 2*ww),
+  ("internal_diameter", ("mean_diameter", "wire_width"),        lambda md, ww: md - ww),
+  ("internal_diameter", ("external_diameter", "wire_width"),    lambda ed, ww: ed - 2*ww),
+  ("height",            ("coil_count", "coil_pitch"),           lambda cc, cp: cc * cp),
+  ("wire_width",        ("external_diameter", "mean_diameter"), lambda ed, md: ed - md),
+  ("wire_width",        ("mean_diameter", "internal_diameter"), lambda md, id: md - id),
+  ("wire_width",        ("external_diameter", "internal_diameter"), lambda ed, id: (ed - id)/2),
+  ("coil_angle",        ("mean_diameter", "coil_pitch"),        lambda md, cp: math.atan(cp / (math.pi * md))),
+  ("coil_pitch",        ("mean_diameter", "coil_angle"),        lambda md, ca: math.pi * md * math.tan(ca)),
+  ("coil_pitch",        ("height", "coil_count"),               lambda h, cc: h / cc),
+  ("coil_count",        ("height", "coil_pitch"),               lambda h, cp: h / cp),
+  ("poissonsratio",     ("elasticitymodulus", "rigiditymodulus"), lambda em, rm: em / (2*rm) - 1),
+  ("elasticitymodulus", ("poissonsratio", "rigiditymodulus"),   lambda pr, rm: 2 * rm * (1 + pr)),
+  ("rigiditymodulus",   ("poissonsratio", "elasticitymodulus"), lambda pr, em: em / (2 * (1 + pr))),
+)
 
-class CircularReferenceError(Exception):
-  pass
+_PLANS = {}
+
+def _plan(known):
+  """Returns the solve order, a tuple of relations, deriving every reachable
+  parameter from the frozenset of 'known' parameters. Plans are compiled once
+  per set of known parameters and cached."""
+  try:
+    return _PLANS[known]
+  except KeyError:
+    pass
+  solved = set(known)
+  plan = []
+  progress = True
+  while progress:
+    progress = False
+    for relation in _RELATIONS:
+      target, inputs, function = relation
+      if target not in solved and solved.issuperset(inputs):
+        solved.add(target)
+        plan.append(relation)
+        progress = True
+  _PLANS[known] = tuple(plan)
+  return _PLANS[known]
+
+def _parameter(name):
+  """Builds the property of a spring parameter. Parameters can be set when
+  they are not yet derived from other parameters."""
+  def fget(self):
+    return self._Spring__get(name)
+  def fset(self, value):
+    self._Spring__set(name, value)
+  def fdel(self):
+    self._Spring__del(name)
+  return property(fget, fset, fdel)
 
 class Spring:
   def __init__(self, external_diameter=None, internal_diameter=None, mean_diameter=None, height=None, # provide one out of three diameters
                      wire_diameter=None,     wire_width=None,        wire_height=None,                # provide diam, or width and height
                      coil_angle=None,        coil_pitch=None,        coil_count=None,                 # provide two out of three
-                     v=None, E=None):
+                     v=None, E=None, G=None):
     self.__cname = 'Spring'
     self.__UD = {"external_diameter": None,  
                  "internal_diameter": None,  
@@ -73,401 +138,126 @@ class Spring:
                  "poissonsratio"    : None,  # v = (E/2G)-1
                  "elasticitymodulus": None,  # E = 2G(1+v)
                  "rigiditymodulus"  : None}  # G = E/(2(1+v))
-  if True:  # property calculations
-    def __mean_diameter(self, source=None):        # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      # define the different methods with which to get or calculate 'me'
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        ed = self.__external_diameter(source)
-        ww = self.__wire_width(source)
-        if not None in [ed, ww]:
-          return ed[0] - ww[0], utils.union(ed[1], ww[1])
-      def m2(self):
-        id = self.__internal_diameter(source)
-        ww = self.__wire_width(source)
-        if not None in [id, ww]:
-          return id[0] + ww[0], utils.union(id[1], ww[1])
-      def m3(self):
-        cp = self.__coil_pitch(source)
-        ca = self.__coil_angle(source)
-        if not None in [cp, ca]:
-          return cp[0] / (math.pi * math.tan(ca[0])), utils.union(cp[1], ca[1])
-      def m4(self):
-        h  = self.__height(source)
-        cc = self.__coil_count(source)
-        ca = self.__coil_angle(source)
-        if not None in [h, cc, ca]:
-          return h[0] / (math.pi * cc[0] * math.tan(ca[0])), utils.union(h[1], cc[1], ca[1])
-      for m in (m0, m1, m2, m3, m4):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __external_diameter(self, source=None):    # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        md = self.__mean_diameter(source)
-        ww = self.__wire_width(source)
-        if not None in [md, ww]:
-          return md[0] + ww[0], utils.union(md[1], ww[1])
-      def m2(self):
-        id = self.__internal_diameter(source)
-        ww = self.__wire_width(source)
-        if not None in [id, ww]:
-          return id[0] + 2*ww[0], utils.union(id[1], ww[1])
-      for m in (m0, m1, m2):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __internal_diameter(self, source=None):    # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        md = self.__mean_diameter(source)
-        ww = self.__wire_width(source)
-        if not None in [md, ww]:
-          return md[0] - ww[0], utils.union(md[1], ww[1])
-      def m2(self):
-        ed = self.__external_diameter(source)
-        ww = self.__wire_width(source)
-        if not None in [ed, ww]:
-          return ed[0] - 2*ww[0], utils.union(ed[1], ww[1])
-      for m in (m0, m1, m2):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __height(self, source=None):               # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        cc = self.__coil_count(source)
-        cp = self.__coil_pitch(source)
-        if not None in [cc, cp]:
-          return cc[0] * cp[0], utils.union(cc[1], cp[1])
-      for m in (m0, m1):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __wire_width(self, source=None):           # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        md = self.__mean_diameter(source)
-        ed = self.__external_diameter(source)
-        if not None in [md, ed]:
-          return ed[0] - md[0], utils.union(md[1], ed[1])
-      def m2(self):
-        md = self.__mean_diameter(source)
-        id = self.__internal_diameter(source)
-        if not None in [md, id]:
-          return md[0] - id[0], utils.union(md[1], id[1])
-      def m3(self):
-        ed = self.__external_diameter(source)
-        id = self.__internal_diameter(source)
-        if not None in [ed, id]:
-          return (ed[0] - id[0])/2, utils.union(ed[1], id[1])
-      for m in (m0, m1, m2, m3):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __wire_height(self, source=None):          # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      for m in (m0):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __coil_angle(self, source=None):           # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        md = self.__mean_diameter(source)
-        cp = self.__coil_pitch(source)
-        if not None in [md, cp]:
-          return math.atan(cp[0]/(math.pi * md[0])), utils.union(md[1], cp[1])
-      for m in (m0, m1):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __coil_pitch(self, source=None):           # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        md = self.__mean_diameter(source)
-        ca = self.__coil_angle(source)
-        if not None in [md, ca]:
-          return math.pi * md[0] * math.tan(ma[0]), utils.union(md[1], ca[1])
-      def m2(self):
-        h  = self.__height(source)
-        cc = self.__coil_count(source)
-        if not None in [h, cc]:
-          return h[0] / cc[0], utils.union(h[1], cc[1])
-      for m in (m0, m1, m2):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __coil_count(self, source=None):           # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        h  = self.__height(source)
-        cp = self.__coil_pitch(source)
-        if not None in [h, cp]:
-          return h[0] / cp[0], utils.union(h[1], cp[1])
-      for m in (m0, m1):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __poissonsratio(self, source=None):        # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        em = self.__elasticitymodulus(source)
-        rm = self.__rigiditymodulus(source)
-        if not None in [em, rm]:
-          return (em[0] / (2*rm[0]) -1), utils.union(em[1], rm[1])
-      for m in (m0, m1):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __elasticitymodulus(self, source=None):    # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        pr = self.__poissonsratio(source)
-        rm = self.__rigiditymodulus(source)
-        if not None in [pr, rm]:
-          return 2 * rm[0] * (1 + pr[0]), utils.union(pr[1], rm[1])
-      for m in (m0, m1):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
-    def __rigiditymodulus(self, source=None):      # done
-      me = whoami().lstrip('_')
-      if source is None: source = []
-      if me in source:   raise(CircularReferenceError())
-      source.append(me)
-      def m0(self):
-        if not self.__UD[me] is None:
-          return self.__UD[me], [me]
-      def m1(self):
-        pr = self.__poissonsratio(source)
-        em = self.__elasticitymodulus(source)
-        if not None in [pr, em]:
-          return em[0] / (2 * (1 + pr[0])), utils.union(pr[1], em[1])
-      for m in (m0, m1):
-        try:
-          r = m()
-          if r: return r
-        except CircularReferenceError:
-          pass
+    self.__solved = None   # (values, sources) of the current parameters
+    for name, value in (("external_diameter", external_diameter),
+                        ("internal_diameter", internal_diameter),
+                        ("mean_diameter",     mean_diameter),
+                        ("height",            height),
+                        ("wire_diameter",     wire_diameter),
+                        ("wire_width",        wire_width),
+                        ("wire_height",       wire_height),
+                        ("coil_angle",        coil_angle),
+                        ("coil_pitch",        coil_pitch),
+                        ("coil_count",        coil_count),
+                        ("poissonsratio",     v),
+                        ("elasticitymodulus", E),
+                        ("rigiditymodulus",   G)):
+      if value is not None: setattr(self, name, value)
+  
+  if True:  # parameter resolution
+    def __solve(self):
+      """Derives all parameters from the provided ones, following the cached
+      plan for this set of provided parameters. Returns the values and, per
+      value, the provided parameters it was derived from."""
+      if self.__solved is None:
+        values = {k: v for k, v in self.__UD.items() if v is not None and k != "wire_round"}
+        sources = {k: (k,) for k in values}
+        for target, inputs, function in _plan(frozenset(values)):
+          values[target] = function(*[values[i] for i in inputs])
+          src = []
+          for i in inputs:
+            src.extend(s for s in sources[i] if s not in src)
+          sources[target] = tuple(src)
+        self.__solved = values, sources
+      return self.__solved
+    def __get(self, par):
+      values, sources = self.__solve()
+      if par in values: return values[par]
+      else:             raise(AttributeError('\'{}\' property not defined.'.format(par)))
+    def __set(self, par, value):
+      values, sources = self.__solve()
+      if (par not in sources) or (sources[par] == (par,)):
+        self.__UD[par] = value
+        self.__solved = None
+      else: raise(AttributeError('\'{}\' property already defined through: {}'.format(par, ', '.join(["'"+p+"'" for p in sources[par]]))))
+    def __del(self, par):
+      values, sources = self.__solve()
+      if (par not in sources) or (sources[par] == (par,)):
+        self.__UD[par] = None
+        self.__solved = None
+      else: raise(AttributeError('\'{}\' property cannot be deleted. Defined through: {}'.format(par, ', '.join(["'"+p+"'" for p in sources[par]]))))
   
   if True:  # Declare standardized properties
-    def __mygetattr__(self, par):
-      val = getattr(self, '_{}__{}'.format(self.__class__.__name__, par))()
-      if val: return val[0]
-      else:   raise(AttributeError('\'{}\' property not defined.'.format(par)))
-    def __mysetattr__(self, par, value):
-      val = getattr(self, '_{}__{}'.format(self.__class__.__name__, par))()
-      if (val is None) or (val[1][0] == par): self.__UD[par] = value
-      else: raise(AttributeError('\'{}\' property already defined through: {}'.format(par, ', '.join(["'"+p+"'" for p in val[1]]))))
-    def __mydelattr__(self, par):
-      val = getattr(self, '_{}__{}'.format(self.__class__.__name__, par))()
-      if not val or val[1][0] == par: self.__UD[par] = None
-      else: raise(AttributeError('\'mean_diameter\' property cannot be deleted. Defined through: {}'.format(', '.join(["'"+p+"'" for p in val[1]]))))
-    @property
-    def mean_diameter(self):            self.__mygetattr__(whoami())
-    @mean_diameter.setter
-    def mean_diameter(self, value):     self.__mysetattr__(whoami(), value)
-    @mean_diameter.deleter
-    def mean_diameter(self):            self.__mydelattr__(whoami())
-    @property
-    def external_diameter(self):        self.__mygetattr__(whoami())
-    @external_diameter.setter
-    def external_diameter(self, value): self.__mysetattr__(whoami(), value)
-    @external_diameter.deleter
-    def external_diameter(self):        self.__mydelattr__(whoami())
-    @property
-    def internal_diameter(self):        self.__mygetattr__(whoami())
-    @internal_diameter.setter
-    def internal_diameter(self, value): self.__mysetattr__(whoami(), value)
-    @internal_diameter.deleter
-    def internal_diameter(self):        self.__mydelattr__(whoami())
-    @property
-    def height(self):                   self.__mygetattr__(whoami())
-    @height.setter
-    def height(self, value):            self.__mysetattr__(whoami(), value)
-    @height.deleter
-    def height(self):                   self.__mydelattr__(whoami())
-    @property
-    def coil_angle(self):               self.__mygetattr__(whoami())
-    @coil_angle.setter
-    def coil_angle(self, value):        self.__mysetattr__(whoami(), value)
-    @coil_angle.deleter
-    def coil_angle(self):               self.__mydelattr__(whoami())
-    @property
-    def coil_pitch(self):               self.__mygetattr__(whoami())
-    @coil_pitch.setter
-    def coil_pitch(self, value):        self.__mysetattr__(whoami(), value)
-    @coil_pitch.deleter
-    def coil_pitch(self):               self.__mydelattr__(whoami())
-    @property
-    def coil_count(self):               self.__mygetattr__(whoami())
-    @coil_count.setter
-    def coil_count(self, value):        self.__mysetattr__(whoami(), value)
-    @coil_count.deleter
-    def coil_count(self):               self.__mydelattr__(whoami())
-    @property
-    def poissonsratio(self):            self.__mygetattr__(whoami())
-    @poissonsratio.setter
-    def poissonsratio(self, value):     self.__mysetattr__(whoami(), value)
-    @poissonsratio.deleter
-    def poissonsratio(self):            self.__mydelattr__(whoami())
-    @property
-    def elasticitymodulus(self):        self.__mygetattr__(whoami())
-    @elasticitymodulus.setter
-    def elasticitymodulus(self, value): self.__mysetattr__(whoami(), value)
-    @elasticitymodulus.deleter
-    def elasticitymodulus(self):        self.__mydelattr__(whoami())
-    @property
-    def rigiditymodulus(self):          self.__mygetattr__(whoami())
-    @rigiditymodulus.setter
-    def rigiditymodulus(self, value):   self.__mysetattr__(whoami(), value)
-    @rigiditymodulus.deleter
-    def rigiditymodulus(self):          self.__mydelattr__(whoami())
-    
+    mean_diameter     = _parameter("mean_diameter")
+    external_diameter = _parameter("external_diameter")
+    internal_diameter = _parameter("internal_diameter")
+    height            = _parameter("height")
+    coil_angle        = _parameter("coil_angle")
+    coil_pitch        = _parameter("coil_pitch")
+    coil_count        = _parameter("coil_count")
+    poissonsratio     = _parameter("poissonsratio")
+    elasticitymodulus = _parameter("elasticitymodulus")
+    rigiditymodulus   = _parameter("rigiditymodulus")
+  
   if True:  # Declare customized properties
     if True:  # wire_diameter
       @property
       def wire_diameter(self):
-        me = whoami()
-        val = getattr(self, '_{}__{}'.format(self.__class__.__name__, 'wire_width'))()
-        if self.__UD['wire_round'] is True and val: return val[0]
-        elif self.__UD['wire_round'] is None and val:
-          warnings.warn('\'{}\' derived from other parameters. Assuming round wire.'.format(me))
-          return val[0]
-        else: raise(AttributeError('\'{}\' property not defined.'.format(me)))
+        val = self.__get('wire_width')
+        if self.__UD['wire_round'] is True: return val
+        elif self.__UD['wire_round'] is None:
+          warnings.warn('\'wire_diameter\' derived from other parameters. Assuming round wire.')
+          return val
+        else: raise(AttributeError('\'wire_diameter\' unavailable. Rectangular wire selected.'))
       @wire_diameter.setter
       def wire_diameter(self, value):
-        me = whoami()
-        val = getattr(self, '_{}__{}'.format(self.__class__.__name__, 'wire_width'))()
-          if (val is None) or (val[1][0] == 'wire_width' and self.__UD['wire_round']):
-            self.__UD['wire_width']
+        if self.__UD['wire_round'] is False:
+          raise(AttributeError('\'wire_diameter\' unavailable. Rectangular wire selected.'))
+        self.__set('wire_width', value)
+        self.__UD['wire_round'] = True
+        self.__UD['wire_height'] = value
       @wire_diameter.deleter
       def wire_diameter(self):
+        self.__del('wire_width')
+        self.__UD['wire_round'] = None
+        self.__UD['wire_height'] = None
     if True:  # wire_width
       @property
       def wire_width(self):
-        me = whoami()
-        val = getattr(self, '_{}__{}'.format(self.__class__.__name__, me))()
-        if self.__UD['wire_round'] is False and val: return val[0]
-        else: raise(AttributeError('\'{}\' property not defined.'.format(me)))
+        if self.__UD['wire_round'] is True:
+          raise(AttributeError('\'wire_width\' and \'wire_height\' unavailable. Round wire selected.'))
+        return self.__get('wire_width')
       @wire_width.setter
       def wire_width(self, value):
-        me = whoami()
-        val = getattr(self, '_{}__{}'.format(self.__class__.__name__, me))()
-        if (val is None) or (val[1][0] == me and self.__UD['wire_round'] is False):
-          self.__UD['wire_round'] = False
-          self.__UD[me]           = value
-        else:
-          if self.__UD['wire_round'] is True:
-            raise(AttributeError('\'wire_width\' and \'wire_height\' unavailable. Round wire selected.'))
-          else:
-            raise(AttributeError('\'{}\' property already defined through: {}'.format(me, ', '.join(["'"+p+"'" for p in val[1]]))))
+        if self.__UD['wire_round'] is True:
+          raise(AttributeError('\'wire_width\' and \'wire_height\' unavailable. Round wire selected.'))
+        self.__set('wire_width', value)
+        self.__UD['wire_round'] = False
       @wire_width.deleter
       def wire_width(self):
+        self.__del('wire_width')
+        if self.__UD['wire_height'] is None: self.__UD['wire_round'] = None
     if True:  # wire_height
       @property
       def wire_height(self):
+        if self.__UD['wire_round'] is True:
+          raise(AttributeError('\'wire_width\' and \'wire_height\' unavailable. Round wire selected.'))
+        return self.__get('wire_height')
       @wire_height.setter
       def wire_height(self, value):
+        if self.__UD['wire_round'] is True:
+          raise(AttributeError('\'wire_width\' and \'wire_height\' unavailable. Round wire selected.'))
+        self.__set('wire_height', value)
+        self.__UD['wire_round'] = False
       @wire_height.deleter
       def wire_height(self):
-    
-    
-    
-    
-    
+        self.__del('wire_height')
+        if self.__UD['wire_width'] is None: self.__UD['wire_round'] = None
 
-def spring(D, w, h, n, P, G):
+
+@units.stripped(('m', 'Pa'), D='m', w='m', h='m', n='', P='N', G='Pa')
+def spring_kernel(D, w, h, n, P, G):
+  """Float kernel of spring(). Returns deflection and shear stress in SI units."""
   a = max(w, h)/2
   b = min(w, h)/2
   R = (D-w)/2
@@ -482,34 +272,81 @@ def spring(D, w, h, n, P, G):
     if w > h and c <= 5: raise(Exception('Cannot calculate.'))
     f = ((3 * math.pi * P * R**3 * n) / (8 * G * b**4)) * (1 / ((a/b) - 0.627*(math.tanh((math.pi * b)/(2*a)) + 0.004)))
     t = ((P * R * (3*b + 1.8*a))/(8 * b**2 * a**2)) * (1 + (1.2/c) + (0.56/c**2) + (0.5/c**3))
+  return f, t
+
+def spring(D, w, h, n, P, G):
+  f, t = spring_kernel(D, w, h, n, P, G)
   return f.to('mm'), t.to('MPa')
 
+@units.stripped(('m', 'Pa'), D='m', w='m', h='m', n='', P='N', G='Pa')
+def spring_array(D, w, h, n, P, G):
+  """Array version of spring_kernel(). Arguments are broadcast against each
+  other, so whole grids of designs are evaluated in one call, e.g. with
+  D[:, None] and w[None, :]. Cells outside the validity range of the formulas
+  are NaN instead of raising, use np.isnan() for the mask."""
+  D, w, h, n, P, G = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in (D, w, h, n, P, G)])
+  a = np.maximum(w, h)/2
+  b = np.minimum(w, h)/2
+  R = (D-w)/2
+  with np.errstate(divide='ignore', invalid='ignore'):
+    c = R/b
+    valid = np.where((w == h) | (h > w), c > 3, c > 5)
+    k = (1 + (1.2/c) + (0.56/c**2) + (0.5/c**3))
+    f = np.where(w == h,
+                 (2.789 * P * R**3 * n) / (G * b**4),
+                 ((3 * np.pi * P * R**3 * n) / (8 * G * b**4)) * (1 / ((a/b) - 0.627*(np.tanh((np.pi * b)/(2*a)) + 0.004))))
+    t = np.where(w == h,
+                 ((4.8 * P * R) / (8 * b**3)) * k,
+                 ((P * R * (3*b + 1.8*a))/(8 * b**2 * a**2)) * k)
+  return np.where(valid, f, np.nan), np.where(valid, t, np.nan)
+
+
+def _height_rows(D, w, n, P, G, h):
+  # Rows of a single wire height, module level to be usable by sweep workers.
+  h = units.magnitude(h, 'm')
+  f, t = spring_array.kernel(D, w, h, n, P, G)
+  return list(zip(np.full(len(w), h*1e3).tolist(), (w*1e3).tolist(), (f*1e3).tolist(), (t/1e6).tolist()))
+
+def _sweep_heights(D, wr, hr, n, P, G, processes, chunksize):
+  w = np.array([units.magnitude(x, 'm') for x in wr], dtype=float)
+  D, n, P, G = units.magnitude(D, 'm'), units.magnitude(n, ''), units.magnitude(P, 'N'), units.magnitude(G, 'Pa')
+  return sweep.imap(functools.partial(_height_rows, D, w, n, P, G), hr, chunksize, processes)
+
+def spring_rows(D, wr, hr, n, P, G, processes=1, chunksize=16):
+  """Yields (h, w, f, t) rows over the grid of wire heights 'hr' and wire widths
+  'wr', evaluating one wire height at a time with spring_array(). Lengths in
+  mm, stresses in MPa, NaN outside the validity range. 'hr' may be any
+  iterable, including a generator. With 'processes' other than 1, chunks of
+  'chunksize' wire heights are spread over a process pool (None for all
+  cores). Rows are yielded in the same order either way."""
+  for rows in _sweep_heights(D, wr, hr, n, P, G, processes, chunksize):
+    yield from rows
 
-def mktable(D, wr, hr, n, P, G):
-  values = [[None]]
+def mktable(D, wr, hr, n, P, G, file='output.csv', fmt='pivot', processes=1, chunksize=16):
+  """Writes the spring table for all wire widths 'wr' and heights 'hr' to
+  'file', a path or file object. Rows are streamed as they are calculated.
+  'fmt' is 'pivot' for the CSV with one line per wire height and an f, t
+  column pair per wire width, or any of tables.WRITERS for (h, w, f, t) rows.
+  'processes' and 'chunksize' are passed on to spring_rows()."""
+  if fmt != 'pivot':
+    return tables.write_table(spring_rows(D, wr, hr, n, P, G, processes, chunksize),
+                              ('h (mm)', 'w (mm)', 'f (mm)', 't (MPa)'), file, fmt)
+  if isinstance(file, str):
+    with open(file, 'w', encoding='utf-8') as f:
+      return mktable(D, wr, hr, n, P, G, f, fmt, processes, chunksize)
   wr = list(wr)
-  for h in hr:
-    values.append([h])
-    for w in wr:
-      if not w in values[0]: values[0].append(w)
-      f, t = spring(D, w, h, n, P, G)
-      values[-1].append([f, t])
-  with open('output.csv', 'w', encoding='utf-8') as f:
-    # ,3 mm,,4 mm,,5 mm,
-    # ,f (mm),t (MPa),f (mm),t (MPa),f (mm),t (MPa)
-    # 10 mm,53.4,987,50.1,778,45.8,669
-    f.write(''.join([',{0.magnitude:.1f} {0.units:~P},'.format(i) for i in values[0][1:]]))
-    f.write('\n')
-    f.write(''.join([',f (mm),t (MPa)' for i in values[0][1:]]))
-    f.write('\n')
-    for lines in values[1:]:
-      f.write('{0.magnitude:.1f} {0.units:~P},'.format(lines[0]))
-      f.write(','.join(['{.magnitude:.1f},{.magnitude:.0f}'.format(i[0], i[1]) for i in lines[1:]]))
-      f.write('\n')
-    
-    
-    
-    
-      
-      
-      
\ No newline at end of file
+  hr, labels = itertools.tee(hr)
+  # ,3 mm,,4 mm,,5 mm,
+  # ,f (mm),t (MPa),f (mm),t (MPa),f (mm),t (MPa)
+  # 10 mm,53.4,987,50.1,778,45.8,669
+  file.write(''.join([',{0.magnitude:.1f} {0.units:~P},'.format(i) for i in wr]))
+  file.write('\n')
+  file.write(''.join([',f (mm),t (MPa)' for i in wr]))
+  file.write('\n')
+  count = 0
+  for h, values in zip(labels, _sweep_heights(D, wr, hr, n, P, G, processes, chunksize)):
+    file.write('{0.magnitude:.1f} {0.units:~P},'.format(h))
+    file.write(','.join(['{:.1f},{:.0f}'.format(i[2], i[3]) for i in values]))
+    file.write('\n')
+    count += len(values)
+  return count
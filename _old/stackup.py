@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Statistical tolerance stack-up. Samples every contributor of a dimension
+chain with NumPy in batches and reports the resulting distribution.
+"""
+# NumPy is imported by the functions sampling, so the pure Python running sums
+# used when constructing a Dim don't load it.
+
+__all__ = ['DISTRIBUTIONS', 'StackupResult', 'monte_carlo', 'moments', 'negate']
+
+DISTRIBUTIONS = ('normal', 'uniform', 'triangular')
+
+def moments(value, dmin, dmax, dist):
+  """
+Running aggregates of a single contributor, summed over a stack-up:
+  (value, dmin, dmax, mid, halfsq, mean, var)
+with 'mid' the middle of the tolerance band relative to the nominal value,
+'halfsq' the squared half band width used for root-sum-square, and 'mean' and
+'var' the mean and variance of the contributor's distribution.
+
+  """
+  low, high = value + dmin, value + dmax
+  if dist == 'normal':
+    mean, var = (low + high) / 2, ((high - low) / 6)**2
+  elif dist == 'uniform':
+    mean, var = (low + high) / 2, (high - low)**2 / 12
+  elif dist == 'triangular':
+    mode = min(max(value, low), high)
+    mean = (low + mode + high) / 3
+    var = (low**2 + mode**2 + high**2 - low*mode - low*high - mode*high) / 18
+  else:
+    raise(ValueError('Unknown distribution: \'{}\''.format(dist)))
+  return (value, dmin, dmax, (dmin + dmax) / 2, ((dmax - dmin) / 2)**2, mean, var)
+
+def negate(sums):
+  """Aggregates of a subtracted contributor. The lower deviation of a
+  subtracted dimension stems from its upper deviation and vice versa."""
+  value, dmin, dmax, mid, halfsq, mean, var = sums
+  return (-value, -dmax, -dmin, -mid, halfsq, -mean, var)
+
+class StackupResult:
+  def __init__(self, samples, lsl=None, usl=None):
+    """Distribution of a simulated stack-up. 'lsl' and 'usl' are the lower and
+    upper specification limits used by cpk()."""
+    import numpy as np
+    self.samples = samples
+    self.lsl = lsl
+    self.usl = usl
+    self.mean = float(np.mean(samples))
+    self.std = float(np.std(samples, ddof=1)) if len(samples) > 1 else 0.0
+    self.min = float(np.min(samples))
+    self.max = float(np.max(samples))
+  def __repr__(self):
+    return "<class '{0}.{1}'> mean {2:} std {3:} ({4:} samples)".format(self.__module__, self.__class__.__name__, self.mean, self.std, len(self.samples))
+  def percentile(self, q):
+    """Percentile(s) 'q' (0-100) of the simulated distribution."""
+    import numpy as np
+    return np.percentile(self.samples, q)
+  def histogram(self, bins=50):
+    """Returns the (counts, bin_edges) of the simulated distribution."""
+    import numpy as np
+    return np.histogram(self.samples, bins=bins)
+  def fraction_outside(self, lsl=None, usl=None):
+    """Fraction of samples outside the specification limits."""
+    import numpy as np
+    lsl = self.lsl if lsl is None else lsl
+    usl = self.usl if usl is None else usl
+    outside = np.zeros(len(self.samples), dtype=bool)
+    if lsl is not None: outside |= self.samples < lsl
+    if usl is not None: outside |= self.samples > usl
+    return float(np.mean(outside))
+  def cpk(self, lsl=None, usl=None):
+    """Process capability index for the specification limits. Uses the limits
+    given at construction when none are provided."""
+    lsl = self.lsl if lsl is None else lsl
+    usl = self.usl if usl is None else usl
+    if lsl is None and usl is None:
+      raise(ValueError('No specification limits provided.'))
+    if self.std == 0:
+      return float('inf')
+    return min((usl - self.mean) / (3*self.std) if usl is not None else float('inf'),
+               (self.mean - lsl) / (3*self.std) if lsl is not None else float('inf'))
+
+def monte_carlo(contributors, samples=10**6, lsl=None, usl=None, seed=None, batchsize=2**22):
+  """
+Simulates a stack-up of (sign, value, dmin, dmax, distribution) contributors.
+The distribution is one of DISTRIBUTIONS:
+  'normal'      mean at the middle of the tolerance band, band width is 6 sigma
+  'uniform'     uniform over the tolerance band
+  'triangular'  peak at the nominal value, limited to the tolerance band
+Normal contributors are summed analytically into a single normal draw, the
+others are drawn in batches of at most 'batchsize' random numbers.
+
+  """
+  import numpy as np
+  rng = np.random.default_rng(seed)
+  groups = {d: [] for d in DISTRIBUTIONS}
+  for sign, value, dmin, dmax, dist in contributors:
+    if dist not in groups:
+      raise(ValueError('Unknown distribution: \'{}\''.format(dist)))
+    groups[dist].append((sign, value + dmin, value, value + dmax))
+  for d in DISTRIBUTIONS:
+    groups[d] = np.array(groups[d], dtype=float).reshape(-1, 4)
+
+  # Zero-width contributors are constants.
+  offset = 0.0
+  for d in ('uniform', 'triangular'):
+    g = groups[d]
+    fixed = g[:, 1] == g[:, 3]
+    offset += np.sum(g[fixed, 0] * g[fixed, 1])
+    groups[d] = g[~fixed]
+
+  g = groups['normal']
+  mean = offset + np.sum(g[:, 0] * (g[:, 1] + g[:, 3]) / 2)
+  sd = np.sqrt(np.sum(((g[:, 3] - g[:, 1]) / 6)**2))
+  result = rng.normal(mean, sd, samples) if sd > 0 else np.full(samples, mean)
+
+  for d in ('uniform', 'triangular'):
+    g = groups[d]
+    if len(g) == 0: continue
+    sign, low, high = g[:, 0, None], g[:, 1, None], g[:, 3, None]
+    mode = np.clip(g[:, 2], g[:, 1], g[:, 3])[:, None]
+    step = max(1, batchsize // len(g))
+    for start in range(0, samples, step):
+      n = min(step, samples - start)
+      if d == 'uniform':
+        draw = rng.uniform(low, high, (len(g), n))
+      else:
+        draw = rng.triangular(low, mode, high, (len(g), n))
+      result[start:start+n] += np.sum(sign * draw, axis=0)
+  return StackupResult(result, lsl, usl)
@@ -2,11 +2,16 @@
 
 import math
 import re
-import pint
+import numpy as np
+from . import units as screwed_units
 
-u = pint.UnitRegistry()
+__all__ = ['von_mises', 'von_mises_array', 'principal_stresses', 'tresca']
 
-__all__ = ['von_mises']
+def __getattr__(name):
+  # The module level registry 'u' is the shared one, built on first use.
+  if name == 'u':
+    return screwed_units.registry()
+  raise(AttributeError('module \'{}\' has no attribute \'{}\''.format(__name__, name)))
 
 def von_mises(sx=0, sy=0, sz=0, txy=0, tyz=0, txz=0):
   """
@@ -16,6 +21,53 @@ normal stress components () and three principal shear stresses.
   """
   return (((sx-sy)**2 + (sy-sz)**2 + (sz-sx)**2 + 6*(txy**2+tyz**2+txz**2))/2)**(1/2)
 
+def _components(voigt, sx, sy, sz, txy, tyz, txz):
+  # Voigt notation orders the components as (sx, sy, sz, tyz, txz, txy).
+  if voigt is None:
+    return np.broadcast_arrays(*[np.asarray(c, dtype=float) for c in (sx, sy, sz, txy, tyz, txz)])
+  voigt = np.asarray(voigt, dtype=float)
+  if voigt.shape[-1] != 6:
+    raise(ValueError('Voigt array should have 6 components along its last axis.'))
+  return (voigt[..., 0], voigt[..., 1], voigt[..., 2],
+          voigt[..., 5], voigt[..., 3], voigt[..., 4])
+
+def von_mises_array(sx=0, sy=0, sz=0, txy=0, tyz=0, txz=0, voigt=None):
+  """
+Array version of von_mises(). Takes either broadcastable arrays of the six
+stress components, or a single (..., 6) array in Voigt order
+(sx, sy, sz, tyz, txz, txy). Returns the equivalent stress for every point.
+
+  """
+  sx, sy, sz, txy, tyz, txz = _components(voigt, sx, sy, sz, txy, tyz, txz)
+  return np.sqrt(((sx-sy)**2 + (sy-sz)**2 + (sz-sx)**2 + 6*(txy**2+tyz**2+txz**2))/2)
+
+def principal_stresses(sx=0, sy=0, sz=0, txy=0, tyz=0, txz=0, voigt=None):
+  """
+Principal stresses for arrays of stress states, accepting the same arguments as
+von_mises_array(). Returns a (..., 3) array sorted as s1 >= s2 >= s3.
+
+  """
+  sx, sy, sz, txy, tyz, txz = _components(voigt, sx, sy, sz, txy, tyz, txz)
+  tensor = np.empty(sx.shape + (3, 3))
+  tensor[..., 0, 0] = sx
+  tensor[..., 1, 1] = sy
+  tensor[..., 2, 2] = sz
+  tensor[..., 0, 1] = tensor[..., 1, 0] = txy
+  tensor[..., 1, 2] = tensor[..., 2, 1] = tyz
+  tensor[..., 0, 2] = tensor[..., 2, 0] = txz
+  return np.linalg.eigvalsh(tensor)[..., ::-1]
+
+def tresca(sx=0, sy=0, sz=0, txy=0, tyz=0, txz=0, voigt=None, principal=None):
+  """
+Tresca equivalent stress (s1 - s3) for arrays of stress states. Precomputed
+principal stresses from principal_stresses() may be passed to skip the
+eigenvalue solve.
+
+  """
+  if principal is None:
+    principal = principal_stresses(sx, sy, sz, txy, tyz, txz, voigt=voigt)
+  return principal[..., 0] - principal[..., 2]
+
 class Material:
   def __init__(self):
     self.elasticity_modulus = None
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Process-pool runner for parameter sweeps. Splits a parameter grid in chunks,
+evaluates the chunks on all cores and reassembles the results in input order,
+so the output is identical to a serial run.
+"""
+import os
+import functools
+import itertools
+import collections
+import concurrent.futures
+import numpy as np
+
+__all__ = ['imap', 'map_columns']
+
+def _apply(function, chunk):
+  return [function(item) for item in chunk]
+
+def _call(function, columns):
+  return function(*columns)
+
+def _ordered(pool, function, chunks, window):
+  """Submits chunks keeping at most 'window' of them in flight, and yields the
+  chunk results in submission order."""
+  pending = collections.deque()
+  for chunk in chunks:
+    pending.append(pool.submit(function, chunk))
+    if len(pending) >= window:
+      yield pending.popleft().result()
+  while pending:
+    yield pending.popleft().result()
+
+def imap(function, items, chunksize=256, processes=None):
+  """
+Lazily applies 'function' to every item of 'items' on a pool of 'processes'
+worker processes (all cores when None), yielding the results in input order.
+Items are consumed 'chunksize' at a time, so arbitrarily long generators can
+be swept. 'function' must be picklable, i.e. defined at module level or a
+functools.partial of one. With processes=1 everything runs in this process.
+
+  """
+  iterator = iter(items)
+  chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+  if processes == 1:
+    for chunk in chunks:
+      yield from _apply(function, chunk)
+    return
+  with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+    window = 2 * (processes or os.cpu_count() or 1)
+    for result in _ordered(pool, functools.partial(_apply, function), chunks, window):
+      yield from result
+
+def map_columns(function, columns, chunksize=65536, processes=None):
+  """
+Evaluates a vectorized 'function(*columns)' over equal-length column arrays,
+in slices of 'chunksize' rows spread over a pool of 'processes' workers.
+Results of the slices are concatenated in order. 'function' may return an
+array, a tuple of arrays or a dictionary of arrays.
+
+  """
+  columns = [np.asarray(c) if np.ndim(c) else c for c in columns]
+  length = max(len(c) for c in columns if np.ndim(c))
+  def slices():
+    for start in range(0, length, chunksize):
+      yield [c[start:start+chunksize] if np.ndim(c) else c for c in columns]
+  if processes == 1:
+    parts = [function(*s) for s in slices()]
+  else:
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+      window = 2 * (processes or os.cpu_count() or 1)
+      parts = list(_ordered(pool, functools.partial(_call, function), slices(), window))
+  if isinstance(parts[0], dict):
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+  elif isinstance(parts[0], tuple):
+    return tuple(np.concatenate(c) for c in zip(*parts))
+  return np.concatenate(parts)
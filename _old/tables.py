@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Streaming table writers. Rows are written as they are produced, so tables
+larger than memory can be generated. Writers share a small interface:
+  writer = Writer(fileobj, columns)
+  writer.write(rows)     # any iterable of row tuples, may be called repeatedly
+  writer.close()         # flushes buffered data, leaves fileobj open
+"""
+import csv
+import json
+import struct
+import numpy as np
+
+__all__ = ['CSVWriter', 'JSONLinesWriter', 'ColumnarWriter', 'WRITERS',
+           'write_table', 'read_columnar']
+
+class CSVWriter:
+  def __init__(self, fileobj, columns):
+    self._csv = csv.writer(fileobj, lineterminator='\n')
+    self._csv.writerow(columns)
+  def write(self, rows):
+    self._csv.writerows(rows)
+  def close(self):
+    pass
+
+class JSONLinesWriter:
+  def __init__(self, fileobj, columns):
+    self._file = fileobj
+    self._columns = tuple(columns)
+  def write(self, rows):
+    for row in rows:
+      self._file.write(json.dumps(dict(zip(self._columns, [_plain(v) for v in row]))))
+      self._file.write('\n')
+  def close(self):
+    pass
+
+class ColumnarWriter:
+  """
+Column-oriented binary format for numeric tables, similar in layout to
+Parquet row groups. Expects a binary file object. Layout, little-endian:
+  magic   b'SCRWCOL1'
+  header  uint32 length, followed by a JSON list of column names
+  groups  uint32 row count, followed per column by that many float64 values
+  end     uint32 0
+Rows are buffered until 'rowgroup' rows are collected.
+
+  """
+  MAGIC = b'SCRWCOL1'
+  def __init__(self, fileobj, columns, rowgroup=65536):
+    self._file = fileobj
+    self._columns = tuple(columns)
+    self._rowgroup = rowgroup
+    self._buffer = []
+    header = json.dumps(list(self._columns)).encode('utf-8')
+    fileobj.write(self.MAGIC + struct.pack('<I', len(header)) + header)
+  def write(self, rows):
+    for row in rows:
+      self._buffer.append(row)
+      if len(self._buffer) >= self._rowgroup:
+        self._flush()
+  def _flush(self):
+    if not self._buffer: return
+    block = np.asarray(self._buffer, dtype='<f8').reshape(len(self._buffer), len(self._columns))
+    self._file.write(struct.pack('<I', len(block)))
+    self._file.write(np.ascontiguousarray(block.T).tobytes())
+    self._buffer = []
+  def close(self):
+    self._flush()
+    self._file.write(struct.pack('<I', 0))
+
+WRITERS = {'csv':      CSVWriter,
+           'jsonl':    JSONLinesWriter,
+           'columnar': ColumnarWriter}
+
+def _plain(v):
+  # JSON has no NaN, numpy scalars aren't serializable.
+  v = float(v) if isinstance(v, (np.floating, np.integer)) else v
+  return None if isinstance(v, float) and v != v else v
+
+def write_table(rows, columns, file, fmt='csv'):
+  """Streams 'rows' to 'file', a path or a file object, in format 'fmt', one
+  of WRITERS. Returns the number of rows written."""
+  if fmt not in WRITERS:
+    raise(ValueError('Unknown table format: \'{}\''.format(fmt)))
+  binary = fmt == 'columnar'
+  if isinstance(file, str):
+    with open(file, 'wb' if binary else 'w', encoding=None if binary else 'utf-8', newline=None if binary else '') as f:
+      return write_table(rows, columns, f, fmt)
+  writer = WRITERS[fmt](file, columns)
+  count = 0
+  def counted(rows):
+    nonlocal count
+    for row in rows:
+      count += 1
+      yield row
+  writer.write(counted(rows))
+  writer.close()
+  return count
+
+def read_columnar(fileobj):
+  """Reads a ColumnarWriter file group by group. Yields a dictionary of NumPy
+  columns per row group."""
+  if fileobj.read(len(ColumnarWriter.MAGIC)) != ColumnarWriter.MAGIC:
+    raise(ValueError('Not a columnar table.'))
+  (length,) = struct.unpack('<I', fileobj.read(4))
+  columns = json.loads(fileobj.read(length).decode('utf-8'))
+  while True:
+    (rows,) = struct.unpack('<I', fileobj.read(4))
+    if rows == 0: return
+    data = np.frombuffer(fileobj.read(8 * rows * len(columns)), dtype='<f8')
+    yield dict(zip(columns, data.reshape(len(columns), rows)))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Batch evaluation of thread strength over tables of thread designations. All
+rows are evaluated with a single call of the vectorized thread_stresses()
+kernel.
+"""
+import numpy as np
+
+from .. import units as screwed_units
+from .. import sweep as screwed_sweep
+from . import profile, thread_stresses, stiffness_ratios, first_turn_share
+
+__all__ = ['evaluate', 'evaluate_columns']
+
+def _geometry(standard):
+  """Returns the (leadangle, trailangle, height/pitch, pitchoffset/pitch)
+  constants of a thread standard from the profile registry."""
+  p = profile(standard)
+  return (p.leadangle, p.trailangle, p.height, p.pitchoffset)
+
+def _column(values, unit):
+  """Converts a column of numbers, a pint array or a sequence of pint
+  quantities to a float array in 'unit'."""
+  if hasattr(values, 'units'):
+    return np.asarray(screwed_units.magnitude(values, unit), dtype=float)
+  return np.array([screwed_units.magnitude(v, unit) for v in values], dtype=float)
+
+def evaluate(rows, processes=1, chunksize=65536):
+  """
+Evaluates a table of (standard, diameter, pitch, starts, load) rows. See
+evaluate_columns() for the returned columns and the other arguments.
+
+  """
+  standard, diameter, pitch, starts, load = zip(*rows)
+  return evaluate_columns(standard, diameter, pitch, starts, load, processes, chunksize)
+
+def evaluate_columns(standard, diameter, pitch, starts, load, processes=1, chunksize=65536):
+  """
+Evaluates columns of thread designations against their loads. Diameters and
+pitches in m and loads in N, or pint quantities. Returns a dictionary of
+NumPy columns holding the inputs and every Thread stress component in Pa,
+e.g. 'm_tau', 'm_lsigma', 'f_tvonmises'. With 'processes' other than 1 the
+rows are evaluated in slices of 'chunksize' rows on a process pool (None for
+all cores), giving the same result.
+
+  """
+  if processes != 1:
+    columns = [np.asarray(standard, dtype=object), _column(diameter, 'm'),
+               _column(pitch, 'm'), np.asarray(starts, dtype=int), _column(load, 'N')]
+    return screwed_sweep.map_columns(evaluate_columns, columns, chunksize, processes)
+  standard = np.asarray(standard, dtype=object)
+  names, index = np.unique(standard.astype(str), return_inverse=True)
+  index = index.reshape(-1)
+  constants = np.array([_geometry(name) for name in names], dtype=float).reshape(-1, 4)
+  leadangle, trailangle, heightfactor, offsetfactor = constants[index].T
+  columns = {"standard": standard,
+             "diameter": _column(diameter, 'm'),
+             "pitch":    _column(pitch, 'm'),
+             "starts":   np.asarray(starts, dtype=int),
+             "load":     _column(load, 'N')}
+  # Load share of the most loaded turn, for the default Thread engagement
+  # length, nut diameter and modulus ratio.
+  dp = columns["diameter"] / columns["pitch"]
+  loadshare = first_turn_share(np.floor(0.8 * dp).clip(1), *stiffness_ratios(dp, heightfactor, 1.5 * dp))
+  columns.update(thread_stresses(columns["diameter"], columns["pitch"],
+                                 heightfactor * columns["pitch"],
+                                 offsetfactor * columns["pitch"],
+                                 leadangle, trailangle, columns["load"], loadshare))
+  return columns
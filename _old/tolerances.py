@@ -1 +1,196 @@
 #!/usr/bin/env python3
+"""
+ISO 286-1 limits and fits for nominal sizes up to 500 mm. Standard tolerance
+grades and fundamental deviations are stored as arrays indexed by size range,
+so designations like "25H7" or "25g6" and whole columns of hole-shaft pairs
+are resolved with NumPy lookups.
+"""
+import re
+import functools
+import numpy as np
+from .iso import DesignationError
+
+__all__ = ['SIZES', 'GRADES', 'FITS', 'DesignationError', 'IT',
+           'fundamental_deviation', 'limits', 'dim', 'classify']
+
+# Upper limits of the size ranges in mm, including the intermediate ranges
+# used by the deviations of r and s. The first range is 0 < size <= 3.
+SIZES = np.array((3, 6, 10, 14, 18, 24, 30, 40, 50, 65, 80, 100, 120, 140, 160,
+                  180, 200, 225, 250, 280, 315, 355, 400, 450, 500))
+# Main range of every range above, for the values that only change per main range.
+_MAIN = np.array((0, 1, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 8, 9, 9, 9, 10, 10,
+                  11, 11, 12, 12))
+
+# Standard tolerances IT1 to IT16 per main size range, in micrometres.
+_IT = np.array((
+  (0.8,  1,    1,    1.2,  1.5,  1.5,  2,    2.5,  3.5,  4.5,  6,    7,    8),
+  (1.2,  1.5,  1.5,  2,    2.5,  2.5,  3,    4,    5,    7,    8,    9,    10),
+  (2,    2.5,  2.5,  3,    4,    4,    5,    6,    8,    10,   12,   13,   15),
+  (3,    4,    4,    5,    6,    7,    8,    10,   12,   14,   16,   18,   20),
+  (4,    5,    6,    8,    9,    11,   13,   15,   18,   20,   23,   25,   27),
+  (6,    8,    9,    11,   13,   16,   19,   22,   25,   29,   32,   36,   40),
+  (10,   12,   15,   18,   21,   25,   30,   35,   40,   46,   52,   57,   63),
+  (14,   18,   22,   27,   33,   39,   46,   54,   63,   72,   81,   89,   97),
+  (25,   30,   36,   43,   52,   62,   74,   87,   100,  115,  130,  140,  155),
+  (40,   48,   58,   70,   84,   100,  120,  140,  160,  185,  210,  230,  250),
+  (60,   75,   90,   110,  130,  160,  190,  220,  250,  290,  320,  360,  400),
+  (100,  120,  150,  180,  210,  250,  300,  350,  400,  460,  520,  570,  630),
+  (140,  180,  220,  270,  330,  390,  460,  540,  630,  720,  810,  890,  970),
+  (250,  300,  360,  430,  520,  620,  740,  870,  1000, 1150, 1300, 1400, 1550),
+  (400,  480,  580,  700,  840,  1000, 1200, 1400, 1600, 1850, 2100, 2300, 2500),
+  (600,  750,  900,  1100, 1300, 1600, 1900, 2200, 2500, 2900, 3200, 3600, 4000)))
+GRADES = tuple(range(1, len(_IT) + 1))
+
+def _per_range(*values):
+  # Expands values per main range to all ranges.
+  return np.array(values)[_MAIN] if len(values) == _MAIN[-1] + 1 else np.array(values)
+
+# Fundamental deviations of shafts in micrometres: the upper deviation es of
+# d to h, the lower deviation ei of k to s. Holes mirror them, see _deviations.
+_SHAFTS = {
+  'd': _per_range(-20, -30, -40, -50, -65, -80, -100, -120, -145, -170, -190, -210, -230),
+  'e': _per_range(-14, -20, -25, -32, -40, -50, -60, -72, -85, -100, -110, -125, -135),
+  'f': _per_range(-6, -10, -13, -16, -20, -25, -30, -36, -43, -50, -56, -62, -68),
+  'g': _per_range(-2, -4, -5, -6, -7, -9, -10, -12, -14, -15, -17, -18, -20),
+  'h': _per_range(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+  'k': _per_range(0, 1, 1, 1, 2, 2, 2, 3, 3, 4, 4, 4, 5),  # IT4 to IT7 only
+  'm': _per_range(2, 4, 6, 7, 8, 9, 11, 13, 15, 17, 20, 21, 23),
+  'n': _per_range(4, 8, 10, 12, 15, 17, 20, 23, 27, 31, 34, 37, 40),
+  'p': _per_range(6, 12, 15, 18, 22, 26, 32, 37, 43, 50, 56, 62, 68),
+  'r': _per_range(10, 15, 19, 23, 23, 28, 28, 34, 34, 41, 43, 51, 54, 63, 65, 68,
+                  77, 80, 84, 94, 98, 108, 114, 126, 132),
+  's': _per_range(14, 19, 23, 28, 28, 35, 35, 43, 43, 53, 59, 71, 79, 92, 100, 108,
+                  122, 130, 140, 158, 170, 190, 208, 232, 252)}
+_UPPER = 'defgh'
+
+FITS = ('clearance', 'transition', 'interference')
+
+_DESIGNATION = re.compile("^[ ]*([0-9]+[.,]?[0-9]*)?[ ]*([A-Za-z]{1,2})([0-9]+)[ ]*$")
+
+def _range(size):
+  size = np.asarray(size, dtype=float)
+  if np.any((size <= 0) | (size > SIZES[-1])):
+    raise(ValueError('Nominal size outside ISO 286-1 range of 0 to {} mm'.format(SIZES[-1])))
+  return np.searchsorted(SIZES, size)
+
+def IT(grade, size):
+  """Standard tolerance of IT 'grade' for nominal 'size' in mm, in
+  micrometres. Accepts arrays of sizes."""
+  if grade not in GRADES:
+    raise(ValueError('Standard tolerance grade not in table: IT{}'.format(grade)))
+  return _IT[grade - 1][_MAIN[_range(size)]]
+
+def _deviations(position, grade, r):
+  """(lower, upper) deviations in micrometres for size range indices 'r'."""
+  it = _IT[grade - 1][_MAIN[r]]
+  if position in ('js', 'JS'):
+    return -it / 2, it / 2
+  shaft = position.lower()
+  if shaft not in _SHAFTS:
+    raise(ValueError('Tolerance position not supported: \'{}\''.format(position)))
+  fd = _SHAFTS[shaft][r]
+  if shaft == 'k' and not 4 <= grade <= 7:
+    fd = np.zeros_like(fd)
+  if position.islower():
+    return (fd - it, fd) if shaft in _UPPER else (fd, fd + it)
+  if shaft in _UPPER:
+    # Holes A to H mirror the shaft: EI = -es.
+    return -fd, -fd + it
+  # Holes K to S: ES = -ei, plus the difference of the grade and the next
+  # finer grade for the finer grades, except for sizes up to 3 mm.
+  if shaft == 'k' and grade > 8:
+    es = np.zeros_like(fd)
+  elif shaft == 'n' and grade > 8:
+    es = np.zeros_like(fd)
+  elif (shaft in 'kmn' and grade <= 8) or (shaft in 'prs' and grade <= 7):
+    if shaft == 'k':
+      fd = _SHAFTS['k'][r]
+    delta = np.where(r == 0, 0, it - _IT[grade - 2][_MAIN[r]]) if grade > 1 else 0
+    es = -fd + delta
+  else:
+    es = -fd
+  return es - it, es
+
+def fundamental_deviation(position, grade, size):
+  """Fundamental deviation in micrometres of a tolerance 'position' (d to s
+  for shafts, D to S for holes, js/JS) in IT 'grade' for nominal 'size' in
+  mm: the deviation closest to the nominal size. Accepts arrays of sizes."""
+  lower, upper = _deviations(position, grade, _range(size))
+  return np.where(np.abs(lower) < np.abs(upper), lower, upper)
+
+@functools.lru_cache(maxsize=65536)
+def _parse(designation):
+  match = _DESIGNATION.match(designation)
+  if match is None:
+    raise(DesignationError(designation, 'Not a tolerance designation'))
+  nominal, position, grade = match.groups()
+  if nominal is None:
+    raise(DesignationError(designation, 'Nominal size missing'))
+  nominal = float(nominal.replace(',', '.'))
+  grade = int(grade)
+  if grade not in GRADES:
+    raise(DesignationError(designation, 'Standard tolerance grade not in table'))
+  if position not in ('js', 'JS') and (len(position) != 1 or position.lower() not in _SHAFTS):
+    raise(DesignationError(designation, 'Tolerance position not supported'))
+  try:
+    lower, upper = _deviations(position, grade, _range(nominal))
+  except ValueError as e:
+    raise(DesignationError(designation, str(e)))
+  return nominal, float(lower) / 1000, float(upper) / 1000, position.isupper()
+
+def limits(designations):
+  """
+Nominal sizes and deviations of an array of designations like "25H7" or
+"25g6". Every distinct designation is decoded once. Returns a dictionary of
+arrays in mm: nominal, lower and upper deviation, min and max size, and
+whether the designation is a hole.
+
+  """
+  designations = np.asarray(designations)
+  names, inverse = np.unique(designations, return_inverse=True)
+  table = np.array([_parse(str(n))[:3] for n in names], dtype=float).reshape(-1, 3)
+  hole = np.array([_parse(str(n))[3] for n in names], dtype=bool)
+  inverse = inverse.reshape(designations.shape)
+  nominal, lower, upper = table[inverse].transpose((-1,) + tuple(range(designations.ndim)))
+  return {'nominal': nominal, 'lower': lower, 'upper': upper,
+          'min': nominal + lower, 'max': nominal + upper, 'hole': hole[inverse]}
+
+def dim(designation, mt='worst-case', dist='normal'):
+  """Returns a Dim of a designation like "25H7", "25g6" or "40js11"."""
+  from . import Dim
+  nominal, lower, upper, hole = _parse(designation)
+  return Dim(nominal, lower, upper, mt=mt, dist=dist)
+
+@functools.lru_cache(maxsize=65536)
+def _split_fit(fit):
+  # '25H7/g6' -> ('25H7', '25g6'), the shaft takes the nominal size of the hole.
+  hole, slash, shaft = fit.partition('/')
+  match = _DESIGNATION.match(hole)
+  if not slash or match is None:
+    raise(DesignationError(fit, 'Not a fit designation'))
+  if _DESIGNATION.match(shaft) and _DESIGNATION.match(shaft).group(1) is None:
+    shaft = (match.group(1) or '') + shaft.strip()
+  return hole, shaft
+
+def classify(holes, shafts=None):
+  """
+Classifies arrays of hole-shaft pairs in one pass. 'holes' and 'shafts' are
+equal length arrays of designations like "25H7" and "25g6". Alternatively
+'holes' holds fit designations like "25H7/g6" and 'shafts' is omitted.
+Returns a dictionary of arrays: the minimum and maximum clearance in mm
+(negative values are interference) and the fit, one of FITS.
+
+  """
+  if shafts is None:
+    fits = np.asarray(holes)
+    names, inverse = np.unique(fits, return_inverse=True)
+    pairs = np.array([_split_fit(str(n)) for n in names], dtype=str).reshape(-1, 2)[inverse.reshape(fits.shape)]
+    holes, shafts = pairs[..., 0], pairs[..., 1]
+  h, s = limits(holes), limits(shafts)
+  if not np.all(h['hole']) or np.any(s['hole']):
+    raise(ValueError('Expected hole and shaft designations, e.g. "25H7" and "25g6".'))
+  low = h['min'] - s['max']
+  high = h['max'] - s['min']
+  fit = np.where(low >= 0, 0, np.where(high <= 0, 2, 1))
+  return {'min_clearance': low, 'max_clearance': high,
+          'fit': np.array(FITS)[fit]}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit handling helpers. Allows float kernels to be called with pint quantities,
+checking and converting the dimensions once at the entry point instead of
+doing every arithmetic operation on pint objects.
+"""
+import sys
+import functools
+import inspect
+
+__all__ = ['registry', 'is_quantity', 'magnitude', 'stripped']
+
+@functools.lru_cache(maxsize=None)
+def registry():
+  """
+Returns the unit registry shared by all modules. pint is imported and the
+registry is built on the first call, as both take a noticeable part of a
+second. The registry is also made the pint application registry, so
+unpickled quantities end up in it.
+
+  """
+  import pint
+  u = pint.UnitRegistry()
+  pint.set_application_registry(u)
+  return u
+
+def is_quantity(val):
+  """True when 'val' is a pint quantity. Doesn't import pint, as no quantity
+  can exist before it is imported."""
+  pint = sys.modules.get('pint')
+  return pint is not None and isinstance(val, pint.Quantity)
+
+def magnitude(val, unit):
+  """
+Returns the magnitude of 'val' expressed in 'unit'. Raises a pint
+DimensionalityError when the dimensions don't match. Plain numbers and arrays
+are assumed to already be expressed in 'unit' and are returned unchanged.
+
+  """
+  if is_quantity(val):
+    return val.to(unit).magnitude
+  return val
+
+def stripped(outputs, **inputs):
+  """
+Decorator running a float kernel on pint quantities. 'inputs' maps argument
+names to the unit the kernel expects them in, e.g. D='m', P='N', n=''.
+'outputs' holds the unit(s) of the kernel result: a single unit string, a
+tuple of units for a tuple result, or a dict for a dict result.
+
+When at least one argument is a pint quantity, the result is wrapped in the
+output units of that quantity's registry. Otherwise the kernel result is
+returned as is. The undecorated kernel remains available as '.kernel'.
+
+  """
+  def decorator(kernel):
+    signature = inspect.signature(kernel)
+    def wrap(registry, result, unit):
+      return registry.Quantity(result, unit)
+    @functools.wraps(kernel)
+    def wrapper(*args, **kwargs):
+      bound = signature.bind(*args, **kwargs)
+      bound.apply_defaults()
+      registry = None
+      for name, unit in inputs.items():
+        val = bound.arguments[name]
+        if is_quantity(val):
+          registry = val._REGISTRY
+          bound.arguments[name] = val.to(unit).magnitude
+      result = kernel(*bound.args, **bound.kwargs)
+      if registry is None:
+        return result
+      if isinstance(outputs, dict):
+        return {k: wrap(registry, v, outputs[k]) for k, v in result.items()}
+      elif isinstance(outputs, tuple):
+        return tuple(wrap(registry, v, unit) for v, unit in zip(result, outputs))
+      else:
+        return wrap(registry, result, outputs)
+    wrapper.kernel = kernel
+    return wrapper
+  return decorator
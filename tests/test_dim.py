@@ -0,0 +1,25 @@
+import pickle
+
+from _old import Dim
+
+
+def test_pickle_shares_sub_assemblies():
+  a, b = Dim(10, .1), Dim(5, .2, -.1, dist='uniform', ct='equivalent')
+  sub = a - b
+  d = (sub + sub) * 2 - a
+  copy = pickle.loads(pickle.dumps(d))
+  assert (copy.value, copy.dmin, copy.dmax, copy.MODEL_TYPE) == (d.value, d.dmin, d.dmax, d.MODEL_TYPE)
+  assert copy._sums == d._sums
+  assert copy.contributors() == d.contributors()
+  (coef, left), = copy._terms[0][1]._terms
+  assert left._terms[0][1] is left._terms[1][1]
+
+
+def test_pickle_deep_stackup():
+  d = Dim(0, .01)
+  for i in range(20000):
+    d = d + Dim(1, .01, mt='rss')
+  copy = pickle.loads(pickle.dumps(d))
+  assert copy._sums == d._sums
+  assert copy.min == d.min and copy.max == d.max
+  assert len(copy.contributors()) == 20001
@@ -0,0 +1,62 @@
+import io
+
+import numpy as np
+import pytest
+
+from _old import fatigue, tables
+
+
+def test_read_history_bytesio():
+  buf = io.BytesIO()
+  tables.write_table(((i, -i) for i in range(10)), ('t', 'load'), buf, 'columnar')
+  buf.seek(0)
+  chunks = list(fatigue.read_history(buf, 'load', chunksize=4))
+  assert [len(c) for c in chunks] == [4, 4, 2]
+  np.testing.assert_array_equal(np.concatenate(chunks), -np.arange(10))
+
+
+def test_read_history_text():
+  chunks = fatigue.read_history(io.StringIO('1 2\n3 4\n\n5 6\n'), column=1)
+  np.testing.assert_array_equal(np.concatenate(list(chunks)), [2, 4, 6])
+
+
+def counted(chunks):
+  # {(low, high): count} of all cycles of a history.
+  result = {}
+  for low, high, count in fatigue.rainflow(chunks):
+    for key, c in zip(zip(low.tolist(), high.tolist()), count.tolist()):
+      result[key] = result.get(key, 0) + c
+  return result
+
+
+def test_rainflow_astm_example():
+  # ASTM E1049 fig. 6: ranges 3 x .5, 4 x 1.5, 6 x .5, 8 x 1, 9 x .5.
+  cycles = counted([[-2, 1, -3, 5, -1, 3, -4, 4, -2]])
+  ranges = {}
+  for (low, high), count in cycles.items():
+    ranges[high - low] = ranges.get(high - low, 0) + count
+  assert ranges == {3: .5, 4: 1.5, 6: .5, 8: 1, 9: .5}
+  assert cycles[(-1, 3)] == 1
+
+
+def test_rainflow_last_sample_closes_cycle():
+  assert counted([[0, 5, 2, 4, -10]]) == {(2, 4): 1, (0, 5): .5, (-10, 5): .5}
+
+
+def test_rainflow_chunked():
+  history = np.random.RandomState(0).normal(size=5000).cumsum()
+  whole = counted([history])
+  for size in (1, 2, 7, 1000):
+    chunks = [history[i:i+size] for i in range(0, len(history), size)]
+    assert counted(chunks) == whole
+
+
+def test_damage():
+  # 100 turning points, at a stress amplitude of 100 at the knee: 99 half cycles.
+  curve = fatigue.SNCurve(100., 3, knee=1e6, endurance=False)
+  damage = fatigue.Damage(curve, factor=2.)
+  for cycles in fatigue.rainflow([np.tile([-50., 50.], 50)]):
+    damage.add(*cycles)
+  assert damage.cycles == 49.5
+  assert damage.damage == pytest.approx(49.5 / 1e6)
+  assert damage.life == pytest.approx(1e6 / 49.5)
@@ -0,0 +1,32 @@
+import json
+import os
+import subprocess
+import sys
+
+from _old import importtime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SCRIPT = '''
+import sys, json
+import _old
+loaded = lambda: sorted(m for m in ('numpy', 'pint', '_old.iso', '_old.thread', '_old.fatigue') if m in sys.modules)
+before = loaded()
+_old.Dim(10, .1) + _old.Dim(5, .2)
+dim = loaded()
+_old.thread
+print(json.dumps([before, dim, loaded()]))
+'''
+
+
+def test_heavy_modules_load_on_access():
+  out = subprocess.run([sys.executable, '-c', _SCRIPT], cwd=ROOT, check=True,
+                       stdout=subprocess.PIPE, universal_newlines=True)
+  before, dim, after = json.loads(out.stdout)
+  assert before == [] and dim == []
+  assert '_old.thread' in after and 'numpy' in after
+
+
+def test_import_budget(monkeypatch):
+  monkeypatch.chdir(ROOT)
+  assert 1000 * importtime.import_time('_old', repeat=3) < importtime.BUDGET
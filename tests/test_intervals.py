@@ -0,0 +1,26 @@
+import math
+
+import numpy as np
+
+from _old import Dim, intervals
+
+
+def test_erf_matches_math():
+  x = np.linspace(-6, 6, 2001)
+  expected = np.array([math.erf(v) for v in x])
+  result = intervals._erf(x)
+  assert result.dtype == np.float64
+  np.testing.assert_allclose(result, expected, atol=1.5e-7)
+
+
+def test_compare_types():
+  a, b, c = Dim(5, .5, -.2), Dim(5.5, .2, -.5), Dim(5.5, .5, -.2)
+  assert a.compare_as('linear.5') == b and a.compare_as('linear.5') != c
+  assert a.compare_as('sd.5') == b and a.compare_as('sd.5') != Dim(5.4, .5, -.2)
+  assert a.compare_as('equivalent') == Dim(5.2, .3, -.4) != a
+
+
+def test_compare_arrays():
+  measured = np.array([9.95, 10.02, 10.2])
+  result = intervals.compare(measured[:, None], measured[:, None], [9.9, 10.0], [10.0, 10.1], 'linear.5')
+  assert result.tolist() == [[True, False], [False, True], [False, False]]
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from _old import iso
+
+
+@pytest.mark.parametrize('P, grade, kind, D, expected', [
+  (1.5,  6, 'D2', 10, 180),
+  (1.5,  6, 'd2', 10, 132),
+  (1.5,  6, 'D1', None, 300),
+  (1.5,  6, 'd',  None, 236),
+  (2.5,  6, 'D1', None, 450),
+  (0.5,  6, 'd2', 3, 75),
+  (0.5,  6, 'D1', None, 140),
+  (0.5,  6, 'D2', 3, 100),
+  (1.25, 7, 'D2', 8, 200),
+  (1.5,  5, 'd2', 10, 106),
+  (4,    6, 'd',  None, 475),
+  (5,    6, 'd2', 48, 250),
+])
+def test_printed_tolerances(P, grade, kind, D, expected):
+  assert iso.tolerance(P, grade, kind, D) == expected
+
+
+@pytest.mark.parametrize('P, position, expected', [
+  (0.5, 'g', -20), (0.7, 'g', -22), (1.25, 'g', -28), (1.5, 'g', -32),
+  (2, 'g', -38), (3.5, 'g', -53), (4, 'g', -60), (1.5, 'G', 32), (1.5, 'H', 0),
+])
+def test_printed_deviations(P, position, expected):
+  assert iso.deviation(P, position) == expected
+
+
+def test_limits_batch():
+  r = iso.limits([10, 10, 20, 3, 36], [1.5, 1.5, 2.5, 0.5, 4], ['6g', '6H', '6H', '6g', '6g'])
+  np.testing.assert_allclose(r['major_max'][[0, 3, 4]], [9.968, 2.980, 35.940], atol=5e-4)
+  np.testing.assert_allclose(r['major_min'][[0, 3, 4]], [9.732, 2.874, 35.465], atol=5e-4)
+  np.testing.assert_allclose(r['pitch_min'], [8.862, 9.026, 18.376, 2.580, 33.118], atol=5e-4)
+  np.testing.assert_allclose(r['pitch_max'], [8.994, 9.206, 18.600, 2.655, 33.342], atol=5e-4)
+  np.testing.assert_allclose(r['minor_min'][[1, 2]], [8.376, 17.294], atol=5e-4)
+  np.testing.assert_allclose(r['minor_max'][[1, 2]], [8.676, 17.744], atol=5e-4)
+  assert np.isnan(r['major_max'][1]) and np.isnan(r['minor_min'][0])
+
+
+def test_undefined_cells_raise():
+  with pytest.raises(ValueError):
+    iso.tolerance(0.2, 8, 'd')
+  with pytest.raises(ValueError):
+    iso.limits(10, 2, '6g')  # no M10x2 in the pitch diameter table
+  with pytest.raises(ValueError):
+    iso.deviation(0.3, 'e')
+
+
+def test_parse_many():
+  result = list(iso.parse_many(['M10x1.5-6H', 'M8 x Ph2,5P1,25 - 7H/7g6g - L - LH']))
+  assert (result[0]['Diameter'], result[0]['Pitch'], result[0]['IntPitchTolerance']) == (10, 1.5, '6H')
+  assert (result[1]['Lead'], result[1]['Pitch'], result[1]['ExtMajorTolerance']) == (2.5, 1.25, '6g')
+  assert result[1]['ThreadEngagement'] == 'L' and result[1]['LeftHandedness']
+
+
+def test_parse_many_errors():
+  designations = ['M10', 'bolt', 'M8x3P2']
+  assert len(list(iso.parse_many(designations, errors='skip'))) == 1
+  yielded = list(iso.parse_many(designations, errors='yield'))
+  assert [type(x) for x in yielded] == [dict, iso.DesignationError, iso.DesignationError]
+  assert (yielded[1].designation, yielded[1].reason) == ('bolt', 'Not a thread designation')
+  assert yielded[2].designation == 'M8x3P2' and 'multiple' in yielded[2].reason
+  with pytest.raises(iso.DesignationError):
+    list(iso.parse_many(designations))
+
+
+def test_parse_many_checks_errors_at_call():
+  with pytest.raises(ValueError):
+    iso.parse_many(['M10'], errors='ignore')
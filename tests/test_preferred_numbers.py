@@ -0,0 +1,17 @@
+from decimal import Decimal
+
+import pytest
+
+from _old import preferred_numbers
+
+
+@pytest.mark.parametrize('value, expected', [(47, 50), (480, 500), (3.3, 5), (1000, 1000)])
+def test_integer_series_keeps_int(value, expected):
+  number = preferred_numbers.Num(value, 'R3').number
+  assert number == expected and type(number) is int
+
+
+def test_float_and_decimal_series():
+  assert preferred_numbers.Num(47, 'R10').number == 50.0
+  assert preferred_numbers.Num(Decimal('3.3'), 'R10').number == Decimal('3.15')
+  assert preferred_numbers.snap(0.3, 'R3') == pytest.approx(0.2)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from _old import roarks
+
+
+def tube(**kwargs):
+  t = roarks.Tube()
+  t.radius_internal = 10.
+  t.radius_external = 20.
+  t.pressure_internal = 30.
+  for name, val in kwargs.items():
+    setattr(t, name, val)
+  return t
+
+
+def test_stress_pressure_lame():
+  s = tube(capped=True).stress_pressure()
+  # a = 10, b = 20, p = 30: A = p a²/(b²-a²) = 10, B = p a²b²/(b²-a²) = 4000.
+  np.testing.assert_allclose(s['radial'], [-30, 0], atol=1e-12)
+  np.testing.assert_allclose(s['hoop'], [50, 20])
+  np.testing.assert_allclose(s['axial'], [10, 10])
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'capped': False}])
+def test_stress_pressure_uncapped(kwargs):
+  s = tube(**kwargs).stress_pressure()
+  np.testing.assert_allclose(s['axial'], [0, 0])
+  np.testing.assert_allclose(s['hoop'], [50, 20])
+
+
+@pytest.mark.parametrize('capped, axial', [(True, 10), (None, 0)])
+def test_stress_pressure_pint(capped, axial):
+  from _old import units
+  u = units.registry()
+  t = roarks.Tube()
+  t.radius_internal = u('10 mm')
+  t.radius_external = u('2 cm')
+  t.pressure_internal = u('30 MPa')
+  if capped is not None:
+    t.capped = capped
+  s = t.stress_pressure()
+  np.testing.assert_allclose(s['radial'].to('MPa').magnitude, [-30, 0], atol=1e-12)
+  np.testing.assert_allclose(s['hoop'].to('MPa').magnitude, [50, 20])
+  np.testing.assert_allclose(s['axial'].to('MPa').magnitude, [axial, axial])
+  assert t.stress_pressure(u('15 mm'))['hoop'].to('MPa').magnitude == pytest.approx(10 + 4000 / 225)
+
+
+@pytest.mark.parametrize('capped', [False, True])
+def test_screen_matches_tube(capped):
+  re = np.array([20., 25., 40.])
+  result = roarks.screen(radius_external=re, wallthickness=10., pressure_internal=30.,
+                         pressure_external=5., capped=capped)
+  for i, r in enumerate(re):
+    t = roarks.Tube()
+    t.radius_external = r
+    t.radius_internal = r - 10
+    t.pressure_internal = 30.
+    t.pressure_external = 5.
+    t.capped = capped
+    s = t.stress_pressure()
+    vm = roarks.von_mises(sx=s['radial'], sy=s['hoop'], sz=s['axial'])
+    assert result['vonmises_internal'][i] == pytest.approx(vm[0])
+    assert result['vonmises_external'][i] == pytest.approx(vm[1])
+  np.testing.assert_allclose(result['radius_internal'], re - 10)
+
+
+def test_screen_uncapped_by_default():
+  kwargs = dict(radius_external=20., radius_internal=10., pressure_internal=30.)
+  default = roarks.screen(**kwargs)
+  assert default['vonmises'] == roarks.screen(capped=False, **kwargs)['vonmises']
+  assert default['vonmises'] != roarks.screen(capped=True, **kwargs)['vonmises']
+
+
+def test_screen_safety_factors():
+  result = roarks.screen(radius_external=20., radius_internal=[10., 18.],
+                         pressure_internal=1., pressure_external=[0., 2.], youngs_modulus=200e3,
+                         yield_strength=250.)
+  np.testing.assert_allclose(result['sf_vonmises'], 250. / result['vonmises'])
+  assert result['buckling_underpressure'][0] == np.inf
+  assert result['buckling_underpressure'][1] == pytest.approx(2 / np.cbrt(3 * 20.**3 / 200e3))
+
+
+@pytest.mark.parametrize('kwargs', [dict(radius_external=20.),
+                                    dict(radius_external=20., radius_internal=10., wallthickness=10.),
+                                    dict(radius_external=20., radius_internal=25.)])
+def test_screen_invalid(kwargs):
+  with pytest.raises(ValueError):
+    roarks.screen(**kwargs)
@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+import pytest
+
+from _old import spring
+
+
+def test_kernel_round_wire():
+  # Square wire: f = 2.789 P R^3 n / (G b^4), R = 35 mm, b = 5 mm.
+  f, t = spring.spring_kernel(.08, .01, .01, 5, 1000., 80e9)
+  assert f == pytest.approx(2.789 * 1000 * .035**3 * 5 / (80e9 * .005**4))
+  assert t == pytest.approx(4.8 * 1000 * .035 / (8 * .005**3) * (1 + 1.2/7 + .56/49 + .5/343))
+
+
+def test_kernel_invalid():
+  with pytest.raises(Exception):
+    spring.spring_kernel(.02, .01, .004, 5, 1000., 80e9)
+
+
+def test_array_matches_kernel():
+  D = np.array([.06, .08, .1])
+  w = np.array([.004, .005, .01, .012])
+  f, t = spring.spring_array(D[:, None], w[None, :], .01, 5, 1000., 80e9)
+  assert f.shape == t.shape == (3, 4)
+  for i, j in np.ndindex(f.shape):
+    try:
+      expected = spring.spring_kernel(D[i], w[j], .01, 5, 1000., 80e9)
+    except Exception:
+      assert math.isnan(f[i, j]) and math.isnan(t[i, j])
+    else:
+      np.testing.assert_allclose((f[i, j], t[i, j]), expected)
+
+
+def test_quantities_use_shared_registry():
+  from _old import units
+  f, t = spring.spring(spring.D, spring.w, spring.h, spring.n, spring.P, spring.G)
+  assert spring.u is units.registry()
+  assert f.units == spring.u.mm and t.units == spring.u.MPa
+  fa, ta = spring.spring_array(spring.D, spring.w, spring.h, spring.n, spring.P, spring.G)
+  assert fa.to('mm').magnitude == pytest.approx(f.magnitude)
+  assert ta.to('MPa').magnitude == pytest.approx(t.magnitude)
+
+
+ANGLE = math.atan(10 / (math.pi * 75))
+
+
+@pytest.mark.parametrize('known', [
+  dict(external_diameter=80, wire_width=5, coil_pitch=10, coil_count=5),
+  dict(internal_diameter=70, mean_diameter=75, height=50, coil_count=5),
+  dict(external_diameter=80, internal_diameter=70, coil_angle=ANGLE, height=50),
+  dict(mean_diameter=75, wire_width=5, coil_pitch=10, height=50)])
+def test_solve_from_known_sets(known):
+  s = spring.Spring(**known)
+  assert s.mean_diameter == pytest.approx(75)
+  assert (s.external_diameter, s.internal_diameter) == pytest.approx((80, 70))
+  assert s.wire_width == pytest.approx(5)
+  assert (s.height, s.coil_pitch, s.coil_count) == pytest.approx((50, 10, 5))
+  assert s.coil_angle == pytest.approx(ANGLE)
+
+
+def test_solve_moduli():
+  s = spring.Spring(E=205e9, G=80e9)
+  assert s.poissonsratio == pytest.approx(205 / 160 - 1)
+  assert spring.Spring(v=.28, G=80e9).elasticitymodulus == pytest.approx(204.8e9)
+
+
+def test_under_determined():
+  s = spring.Spring(external_diameter=80, coil_count=5)
+  for name in ('mean_diameter', 'internal_diameter', 'height', 'coil_angle'):
+    with pytest.raises(AttributeError, match='not defined'):
+      getattr(s, name)
+  s.wire_width = 5
+  assert s.mean_diameter == 75
+  with pytest.raises(AttributeError, match='already defined through'):
+    s.mean_diameter = 70
+
+
+def test_plan_cached():
+  known = frozenset(('external_diameter', 'wire_width'))
+  assert spring._plan(known) is spring._plan(frozenset(known))
+  assert [target for target, inputs, function in spring._plan(known)] == ['mean_diameter', 'internal_diameter']
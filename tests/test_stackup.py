@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from _old import Dim, stackup
+
+
+def chain(mt='worst-case', dist='uniform', dist2='triangular'):
+  return (Dim(50, .2, mt=mt, dist=dist) + Dim(20, .1, -.05, mt=mt, dist=dist2)
+          - Dim(30, .15, mt=mt, dist=dist) + Dim(10, .05, mt=mt, dist=dist))
+
+
+def test_worst_case_contains_monte_carlo():
+  d = chain()
+  result = d.simulate(10**5, seed=1)
+  assert d.min <= result.min and result.max <= d.max
+  assert result.fraction_outside() == 0
+  assert result.mean == pytest.approx(d.statistics()[0], abs=1e-3)
+
+
+def test_rss_matches_monte_carlo_sigma():
+  d = chain('rss', 'normal', 'normal')
+  result = d.simulate(10**5, seed=2)
+  sigma = (d.dmax - d.dmin) / 6
+  assert result.std == pytest.approx(sigma, rel=.02)
+  assert result.std == pytest.approx(d.statistics()[1], rel=.02)
+  assert result.cpk() == pytest.approx(1, rel=.03)
+
+
+def test_uniform_sigma_and_batches():
+  contributors = [(1, 10, -.1, .1, 'uniform')] * 12
+  result = stackup.monte_carlo(contributors, 10**5, seed=3, batchsize=1000)
+  assert result.mean == pytest.approx(120, abs=1e-3)
+  # 12 times a variance of .2**2 / 12.
+  assert result.std == pytest.approx(.2, rel=.02)
+  assert result.min >= 118.8 and result.max <= 121.2
+
+
+def test_seeded():
+  a = chain().simulate(1000, seed=4).samples
+  np.testing.assert_array_equal(a, chain().simulate(1000, seed=4).samples)
+
+
+def test_unknown_distribution():
+  with pytest.raises(ValueError):
+    stackup.monte_carlo([(1, 10, -.1, .1, 'lognormal')], 10)
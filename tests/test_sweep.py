@@ -0,0 +1,34 @@
+import functools
+import math
+
+import numpy as np
+
+from _old import spring, sweep
+
+# Workers need picklable functions, so the tests sweep functions of the
+# package and the standard library.
+
+
+def test_imap_pool_matches_serial():
+  items = (x / 7 for x in range(1000))
+  pooled = list(sweep.imap(math.sqrt, items, chunksize=16, processes=2))
+  assert pooled == list(sweep.imap(math.sqrt, (x / 7 for x in range(1000)), processes=1))
+  assert pooled == [math.sqrt(x / 7) for x in range(1000)]
+
+
+def test_map_columns_pool_matches_serial():
+  D = np.linspace(.05, .1, 1001)
+  columns = (D, .01, .008, 5, 1000., 80e9)
+  pooled = sweep.map_columns(spring.spring_array, columns, chunksize=100, processes=2)
+  serial = sweep.map_columns(spring.spring_array, columns, processes=1)
+  for a, b in zip(pooled, serial):
+    np.testing.assert_array_equal(a, b)
+  np.testing.assert_array_equal(serial[0], spring.spring_array(*columns)[0])
+
+
+def test_spring_rows_pool_matches_serial():
+  u = spring.u
+  widths = [u('4 mm'), u('5 mm'), u('6 mm')]
+  heights = [u('{} mm'.format(h)) for h in range(6, 30)]
+  rows = functools.partial(spring.spring_rows, spring.D, widths, heights, spring.n, spring.P, spring.G)
+  assert list(rows(processes=2, chunksize=5)) == list(rows(processes=1))
@@ -0,0 +1,17 @@
+import pytest
+
+from _old import tables
+
+
+def test_unknown_format_keeps_file(tmp_path):
+  path = tmp_path / 'out.csv'
+  path.write_text('keep')
+  with pytest.raises(ValueError):
+    tables.write_table([(1, 2)], ('a', 'b'), str(path), 'xlsx')
+  assert path.read_text() == 'keep'
+
+
+def test_csv_rows(tmp_path):
+  path = str(tmp_path / 'out.csv')
+  assert tables.write_table(iter([(1, 2), (3, 4)]), ('a', 'b'), path) == 2
+  assert open(path).read().splitlines()[0] == 'a,b'
@@ -0,0 +1,61 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from _old import thread, units
+
+
+def iso_thread(quantities=False):
+  u = units.registry()
+  with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    t = thread.Thread('iso', diameter=u('10 mm') if quantities else .01,
+                      pitch=u('1.5 mm') if quantities else .0015)
+  t.engagement = .8 * t.diameter
+  t.nutdiameter = 1.5 * t.diameter
+  t.modulusratio = 1
+  t.load = u('10 kN') if quantities else 1e4
+  return t
+
+
+@pytest.mark.parametrize('quantities', [False, True])
+def test_properties_match_stresses(quantities):
+  t = iso_thread(quantities)
+  s = t.stresses()
+  for k in thread._STRESSES:
+    assert units.magnitude(getattr(t, k), 'Pa') == pytest.approx(units.magnitude(s[k], 'Pa'))
+  assert units.magnitude(t.m_lvonmises, 'Pa') == pytest.approx(
+    float(np.hypot(units.magnitude(t.m_lsigma, 'Pa'), 3**.5 * units.magnitude(t.m_tau, 'Pa'))))
+
+
+def test_load_change_reuses_stressfactors():
+  t = iso_thread()
+  factors, m_tau = t.stressfactors, t.m_tau
+  t.load = 2e4
+  assert t.stressfactors is factors
+  assert t.m_tau == pytest.approx(2 * m_tau)
+  t.pitch = .00125
+  assert t.stressfactors is not factors
+
+
+@pytest.mark.parametrize('turns, kt_kb, kt_kn', [(1, .1, .1), (5, .2, .1), (12, .05, .3)])
+def test_load_distribution(turns, kt_kb, kt_kn):
+  shares = thread.load_distribution(turns, kt_kb, kt_kn)
+  assert len(shares) == turns
+  assert sum(shares) == pytest.approx(1)
+  assert shares[0] == max(shares)
+  assert all(a > b for a, b in zip(shares, shares[1:]))
+  assert thread.first_turn_share(turns, kt_kb, kt_kn) == pytest.approx(shares[0])
+
+
+def test_load_distribution_limits():
+  # Rigid bolt and nut bodies share the load evenly over the turns, rigid
+  # teeth put it all on the first turn.
+  np.testing.assert_allclose(thread.load_distribution(8, 1e-12, 1e-12), [1/8] * 8)
+  assert thread.load_distribution(8, 1e12, 1e12)[0] == pytest.approx(1)
+
+
+def test_iso_first_turn_share():
+  shares = iso_thread().threadloaddistribution
+  assert len(shares) == 5 and .33 < shares[0] < .45
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from _old import iso, tolerances
+
+
+@pytest.mark.parametrize('grade, size, expected', [(7, 50, 25), (6, 50, 16), (11, 30, 130),
+                                                   (1, 3, .8), (16, 500, 4000)])
+def test_it(grade, size, expected):
+  assert tolerances.IT(grade, size) == expected
+
+
+@pytest.mark.parametrize('designation, lower, upper', [
+  ('50H7', 0, 25), ('50g6', -25, -9), ('25H7', 0, 21), ('25g6', -20, -7),
+  ('30K7', -15, 6),        # ES = -ei + delta, delta = IT7 - IT6 = 8
+  ('30P7', -35, -14),      # ES = -ei + delta for P up to IT7
+  ('30P8', -55, -22),      # no delta above IT7
+  ('3N7', -14, -4),        # no delta up to 3 mm
+  ('40js11', -80, 80), ('100e8', -126, -72), ('160s6', 100, 125)])
+def test_limits(designation, lower, upper):
+  result = tolerances.limits([designation])
+  assert 1000 * result['lower'][0] == pytest.approx(lower)
+  assert 1000 * result['upper'][0] == pytest.approx(upper)
+
+
+def test_classify():
+  result = tolerances.classify(['50H7/g6', '30H7/k6', '30H7/p6'])
+  assert result['fit'].tolist() == ['clearance', 'transition', 'interference']
+  np.testing.assert_allclose(result['min_clearance'], [.009, -.015, -.035])
+  np.testing.assert_allclose(result['max_clearance'], [.050, .019, -.001])
+
+
+@pytest.mark.parametrize('designation', ['H7', '25X7', '25H20', '25H7 g6', '600H7'])
+def test_invalid_designation(designation):
+  with pytest.raises(iso.DesignationError) as e:
+    tolerances.limits([designation])
+  assert e.value.designation == designation
+  assert isinstance(e.value, ValueError)
+
+
+def test_invalid_fit():
+  with pytest.raises(iso.DesignationError, match='Not a fit designation'):
+    tolerances.classify(['25H7'])